@@ -4,6 +4,7 @@ import logging
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from typing import Dict, List, Tuple, Union
@@ -338,22 +339,22 @@ class PhotogrammetryCamera:
         Returns:
             np.ma.array: (n_points, n_channels) One color per valid vertex. Points that were invalid are masked out
         """
-        # Set up the data arrays
+        valid_bool = np.asarray(valid_bool, dtype=bool)
+        # Set up the data array
         colors_per_vertex = np.zeros((valid_bool.shape[0], img.shape[2]))
-        mask = np.ones((valid_bool.shape[0], img.shape[2])).astype(bool)
-
-        # Set the entries which are valid to false, meaning a valid entry in the masked array
-        # TODO see if I can use valid_bool directly instead
-        valid_inds = np.where(valid_bool)[0]
-        mask[valid_inds, :] = False
 
         # Extract coordinates
         i_locs = valid_locs[:, 1]
         j_locs = valid_locs[:, 0]
-        # Index based on the coordinates
-        valid_color_samples = img[i_locs, j_locs, :]
-        # Insert the valid samples into the array at the valid locations
-        colors_per_vertex[valid_inds, :] = valid_color_samples
+        # Index based on the coordinates and insert the valid samples into the array at the valid
+        # locations, using the boolean array directly rather than converting it to indices
+        colors_per_vertex[valid_bool, :] = img[i_locs, j_locs, :]
+
+        # The mask is the per-point validity negated, broadcast across the channels as a zero-copy
+        # view instead of materializing and then overwriting a full (n_points, n_channels) array
+        mask = np.broadcast_to(
+            np.logical_not(valid_bool)[:, None], colors_per_vertex.shape
+        )
         # Convert to a masked array
         masked_color_per_vertex = ma.array(colors_per_vertex, mask=mask)
         return masked_color_per_vertex
@@ -721,12 +722,15 @@ class PhotogrammetryCameraSet:
         return self.image_folder
 
     def find_mising_images(self):
-        invalid_mask = []
-        for image_file in self.image_filenames:
-            if not image_file.is_file():
-                invalid_mask.append(True)
-            else:
-                invalid_mask.append(False)
+        # The existence checks are latency-bound rather than CPU-bound, especially on network
+        # filesystems, so issue them concurrently from a thread pool
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            file_exists = list(
+                executor.map(
+                    lambda image_file: image_file.is_file(), self.image_filenames
+                )
+            )
+        invalid_mask = [not exists for exists in file_exists]
         invalid_images = np.array(self.image_filenames)[np.array(invalid_mask)].tolist()
 
         return invalid_images, invalid_mask
@@ -748,12 +752,12 @@ class PhotogrammetryCameraSet:
         Returns:
             PhotogrammetryCameraSet: A copy of the camera set with only the cameras from that folder
         """
-        # Get the inds where that camera is in the folder
-        imgs_in_folder_inds = [
-            i
-            for i in range(len(self.cameras))
-            if self.cameras[i].image_filename.is_relative_to(folder)
-        ]
+        # Test for membership with a single vectorized string-prefix comparison rather than a
+        # per-camera Path.is_relative_to call. The trailing separator avoids matching sibling
+        # folders that share a name prefix
+        filenames = np.array([str(camera.image_filename) for camera in self.cameras])
+        folder_prefix = str(Path(folder)) + os.sep
+        imgs_in_folder_inds = np.where(np.char.startswith(filenames, folder_prefix))[0]
         # Return the PhotogrammetryCameraSet with those subset of cameras
         subset_cameras = self.get_subset_cameras(imgs_in_folder_inds)
         return subset_cameras
@@ -848,9 +852,15 @@ class PhotogrammetryCameraSet:
             src_file = self.get_image_filename(i, absolute=True)
             if copy:
                 try:
-                    shutil.copy(src_file, output_file)
-                except FileNotFoundError:
-                    logging.warning(f"Could not find {src_file}")
+                    # Hard-link when the source and destination are on the same filesystem,
+                    # which copies no bytes at all
+                    os.link(src_file, output_file)
+                except OSError:
+                    try:
+                        # Fall back to a real copy, which uses zero-copy sendfile on Linux
+                        shutil.copyfile(src_file, output_file)
+                    except FileNotFoundError:
+                        logging.warning(f"Could not find {src_file}")
             else:
                 os.symlink(src_file, output_file)
 
@@ -909,16 +919,23 @@ class PhotogrammetryCameraSet:
 
         if not is_geospatial:
             # get internal coordinate system camera locations
-            image_locations = [Point(*x) for x in self.get_camera_locations()]
-            image_locations_df = gpd.GeoDataFrame(geometry=image_locations)
+            camera_locations = np.array(self.get_camera_locations())
+            # Build the point geometries in one vectorized call rather than per-camera
+            image_locations_df = gpd.GeoDataFrame(
+                geometry=gpd.points_from_xy(
+                    camera_locations[:, 0], camera_locations[:, 1]
+                )
+            )
         else:
             # Make sure it's a geometric (meters-based) CRS
             ROI = ensure_projected_CRS(ROI)
             # Read the locations of all the points
-            image_locations = [Point(*x) for x in self.get_lon_lat_coords()]
-            # Create a dataframe, assuming inputs are lat lon
+            lon_lats = np.array(self.get_lon_lat_coords())
+            # Create a dataframe, assuming inputs are lat lon. The point geometries are built in
+            # one vectorized call rather than per-camera
             image_locations_df = gpd.GeoDataFrame(
-                geometry=image_locations, crs=LAT_LON_CRS
+                geometry=gpd.points_from_xy(lon_lats[:, 0], lon_lats[:, 1]),
+                crs=LAT_LON_CRS,
             )
             image_locations_df.to_crs(ROI.crs, inplace=True)
 
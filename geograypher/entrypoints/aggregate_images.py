@@ -9,7 +9,7 @@ from geograypher.constants import EXAMPLE_IDS_TO_LABELS, PATH_TYPE
 from geograypher.meshes import TexturedPhotogrammetryMesh
 from geograypher.meshes.derived_meshes import TexturedPhotogrammetryMeshChunked
 from geograypher.predictors.derived_segmentors import LookUpSegmentor
-from geograypher.utils.files import ensure_containing_folder
+from geograypher.utils.files import save_numpy_atomic
 from geograypher.utils.indexing import find_argmax_nonzero_value
 
 
@@ -30,6 +30,7 @@ def aggregate_images(
     mesh_downsample: float = 1.0,
     n_aggregation_clusters: typing.Union[int, None] = None,
     aggregate_image_scale: float = 1.0,
+    aggregation_batch_size: int = 1,
     aggregated_face_values_savefile: typing.Union[PATH_TYPE, None] = None,
     predicted_face_classes_savefile: typing.Union[PATH_TYPE, None] = None,
     top_down_vector_projection_savefile: typing.Union[PATH_TYPE, None] = None,
@@ -77,6 +78,10 @@ def aggregate_images(
         aggregate_image_scale (float, optional):
             Downsample the labels before aggregation for faster runtime but lower quality. Defaults
             to 1.0.
+        aggregation_batch_size (int, optional):
+            The number of cameras to compute pixel-to-face correspondences for at once. Larger
+            batches amortize per-call overhead for rendering backends that support batching.
+            Defaults to 1.
         aggregated_face_values_savefile (typing.Union[PATH_TYPE, None], optional):
             Where to save the aggregated image values as a numpy array. Defaults to None.
         predicted_face_classes_savefile (typing.Union[PATH_TYPE, None], optional):
@@ -140,7 +145,7 @@ def aggregate_images(
     segmentor = LookUpSegmentor(
         base_folder=image_folder,
         lookup_folder=label_folder,
-        num_classes=np.max(list(mesh.get_IDs_to_labels().keys())) + 1,
+        num_classes=mesh.get_num_classes(),
     )
     # Create a camera set that returns the segmented images instead of the original ones
     segmentor_camera_set = SegmentorPhotogrammetryCameraSet(
@@ -155,14 +160,23 @@ def aggregate_images(
     ## Perform aggregation, this is the slow step
     aggregated_face_labels, _ = mesh.aggregate_projected_images(
         segmentor_camera_set,
+        batch_size=aggregation_batch_size,
         aggregate_img_scale=aggregate_image_scale,
         **n_clusters_kwargs,
     )
 
     # If requested, save this data
     if aggregated_face_values_savefile is not None:
-        ensure_containing_folder(aggregated_face_values_savefile)
-        np.save(aggregated_face_values_savefile, aggregated_face_labels)
+        values_to_save = aggregated_face_labels
+        # For large meshes this array is gigabytes of I/O, so quantize to half precision when the
+        # values fit. Downstream consumers upcast transparently on load.
+        if (
+            np.issubdtype(values_to_save.dtype, np.floating)
+            and values_to_save.dtype.itemsize > 2
+            and np.nanmax(np.abs(values_to_save), initial=0) < np.finfo(np.float16).max
+        ):
+            values_to_save = values_to_save.astype(np.float16)
+        save_numpy_atomic(aggregated_face_values_savefile, values_to_save)
 
     # Find the index of the most common class per face, with faces with no predictions set to nan
     predicted_face_classes = find_argmax_nonzero_value(
@@ -180,8 +194,7 @@ def aggregate_images(
         )
 
     if predicted_face_classes_savefile is not None:
-        ensure_containing_folder(predicted_face_classes_savefile)
-        np.save(predicted_face_classes_savefile, predicted_face_classes)
+        save_numpy_atomic(predicted_face_classes_savefile, predicted_face_classes)
 
     if vis:
         # Show the mesh with predicted classes
@@ -231,6 +244,7 @@ def parse_args():
     parser.add_argument("--IDs-to-labels", default=EXAMPLE_IDS_TO_LABELS)
     parser.add_argument("--mesh-downsample", type=float, default=1.0)
     parser.add_argument("--aggregate-image-scale", type=float, default=0.25)
+    parser.add_argument("--aggregation-batch-size", type=int, default=1)
     parser.add_argument("--n-aggregation-clusters", type=int)
     parser.add_argument("--aggregated-face-values-savefile", type=Path)
     parser.add_argument("--predicted-face-classes-savefile", type=Path)
@@ -4,13 +4,57 @@ from typing import Union
 import numpy as np
 import pyvista as pv
 from scipy.sparse import load_npz, save_npz
-from SetCoverPy.setcover import SetCover
 
 from geograypher.cameras import MetashapeCameraSet, SegmentorPhotogrammetryCameraSet
 from geograypher.constants import PATH_TYPE
 from geograypher.meshes.derived_meshes import TexturedPhotogrammetryMeshIndexPredictions
 from geograypher.predictors.derived_segmentors import ImageIDSegmentor
-from geograypher.utils.files import ensure_containing_folder
+from geograypher.utils.files import ensure_containing_folder, save_numpy_atomic
+
+
+def greedy_set_cover(projection_matrix) -> np.ndarray:
+    """Approximately solve the set cover problem with the classic greedy algorithm
+
+    At each step, the image that covers the largest number of still-uncovered faces is selected,
+    until no remaining image covers any new face. This provides the standard (1 + ln n)
+    approximation guarantee while operating directly on the sparse matrix, so the (faces, images)
+    matrix is never densified.
+
+    Args:
+        projection_matrix (scipy.sparse.spmatrix):
+            Boolean (n_faces, n_images) matrix where an element is True if that image observes
+            that face
+
+    Returns:
+        np.ndarray: Boolean (n_images,) mask indicating which images were selected
+    """
+    # Column-oriented access lets us cheaply look up which faces an image covers
+    projection_matrix = projection_matrix.tocsc()
+    n_faces, n_images = projection_matrix.shape
+
+    # Initially all faces are uncovered and no images are selected
+    uncovered_faces = np.ones(n_faces, dtype=bool)
+    selected_images = np.zeros(n_images, dtype=bool)
+
+    while np.any(uncovered_faces):
+        # Count how many currently-uncovered faces each image observes
+        scores = np.asarray(
+            projection_matrix[uncovered_faces].sum(axis=0), dtype=int
+        ).ravel()
+        best_image = int(np.argmax(scores))
+        # If the best remaining image covers no new faces, the remaining faces are unobservable
+        if scores[best_image] == 0:
+            break
+        selected_images[best_image] = True
+        # Mark all faces observed by this image as covered
+        covered_faces = projection_matrix.indices[
+            projection_matrix.indptr[best_image] : projection_matrix.indptr[
+                best_image + 1
+            ]
+        ]
+        uncovered_faces[covered_faces] = False
+
+    return selected_images
 
 
 def determine_minimum_overlapping_images(
@@ -25,6 +69,7 @@ def determine_minimum_overlapping_images(
     selected_images_save_folder: Union[PATH_TYPE, None] = None,
     downsample_target: float = 1,
     min_observations_to_be_included: int = 1,
+    use_exact_set_cover: bool = False,
     vis: bool = False,
 ):
     """Determine a subset of images that together cover (or nearly cover) the entire scene.
@@ -60,10 +105,21 @@ def determine_minimum_overlapping_images(
             Ensure that a camera observes all faces that are observed by at least this many cameras.
             Setting to a higher value allows you to avoid including cameras only because they are
             the sole camera to observe a few faces. Defaults to 1.
+        use_exact_set_cover (bool, optional):
+            Solve the set cover problem exactly using SetCoverPy rather than the greedy
+            approximation. This requires densifying the projection matrix and is substantially
+            slower on large scenes. Defaults to False.
         vis (bool, optional):
             Show intermediate results. Note that this will cause the process to hang until the
             visualization is closed. Defaults to False.
     """
+    # Load the camera set once, since both the projection and image-saving phases need it and
+    # parsing the cameras file is slow on large projects
+    if compute_projection or save_selected_images:
+        camera_set = MetashapeCameraSet(
+            camera_file=cameras_file, image_folder=image_folder
+        )
+
     if compute_projection:
         # Load the mesh and optionally downsample it
         mesh = TexturedPhotogrammetryMeshIndexPredictions(
@@ -71,10 +127,6 @@ def determine_minimum_overlapping_images(
             downsample_target=downsample_target,
             transform_filename=cameras_file,
         )
-        # Load the camera set
-        camera_set = MetashapeCameraSet(
-            camera_file=cameras_file, image_folder=image_folder
-        )
         # Visualize the inputs if requested
         if vis:
             mesh.vis(camera_set=camera_set, frustum_scale=15)
@@ -124,42 +176,83 @@ def determine_minimum_overlapping_images(
 
     if compute_minimal_set:
         # Load the projections
-        projection_matrix = load_npz(projections_filename).astype(bool)
-        # Determine how many images project to each face
-        projected_images_per_face = np.squeeze(
-            np.asarray(np.sum(projection_matrix, axis=1))
-        )
+        projection_matrix = load_npz(projections_filename).tocsr().astype(bool)
+        # Determine how many images project to each face. Since the matrix is boolean with no
+        # explicit zeros, the per-row count is just the number of stored entries, which can be
+        # read directly off the CSR index pointer without a sparse reduction
+        projected_images_per_face = np.diff(projection_matrix.indptr)
         # Filter out any faces that don't have at least the threshold observation. This stops us
         # from requiring an image just because it observes a few faces that no other image does
         valid_rows = np.squeeze(
             projected_images_per_face >= min_observations_to_be_included
         )
         projection_matrix = projection_matrix[valid_rows, :]
-        # Convert to a dense matrix
-        # TODO see if we can avoid this step since it takes a fair bit of time and memory
-        projection_matrix = np.asarray(projection_matrix.todense())
-
-        # Define the costs for including each image as unit
-        set_costs = np.ones(projection_matrix.shape[1]).astype(int)
-
-        # Set up the set cover problem
-        problem = SetCover(projection_matrix, set_costs)
-        # Solve the problem
-        solution_cost, time_used = problem.SolveSCP()
-        print(
-            f"The solution cost is {solution_cost} and solving took {time_used} minutes"
-        )
+
+        if use_exact_set_cover:
+            # Only import the solver if it's actually needed
+            from SetCoverPy.setcover import SetCover
+
+            # The solver requires a dense matrix, which is expensive in time and memory for large
+            # scenes. Shrink it first by removing images that can never be part of a minimal
+            # solution: ones that observe no faces, and exact duplicates of an earlier image
+            projection_matrix = projection_matrix.tocsc()
+            n_images = projection_matrix.shape[1]
+            kept_columns = []
+            seen_column_keys = set()
+            for image_ind in range(n_images):
+                covered_faces = projection_matrix.indices[
+                    projection_matrix.indptr[image_ind] : projection_matrix.indptr[
+                        image_ind + 1
+                    ]
+                ]
+                if len(covered_faces) == 0:
+                    continue
+                # The indices are in canonical sorted order so the raw bytes identify the set
+                column_key = covered_faces.tobytes()
+                if column_key in seen_column_keys:
+                    continue
+                seen_column_keys.add(column_key)
+                kept_columns.append(image_ind)
+            kept_columns = np.array(kept_columns, dtype=int)
+
+            # Densify only the surviving columns, writing column-by-column into a preallocated
+            # uint8 array. This is one sequential pass per column and avoids the intermediate
+            # copies made by .todense()
+            dense_projection_matrix = np.zeros(
+                (projection_matrix.shape[0], len(kept_columns)), dtype=np.uint8
+            )
+            for dense_ind, image_ind in enumerate(kept_columns):
+                covered_faces = projection_matrix.indices[
+                    projection_matrix.indptr[image_ind] : projection_matrix.indptr[
+                        image_ind + 1
+                    ]
+                ]
+                dense_projection_matrix[covered_faces, dense_ind] = 1
+
+            # Define the costs for including each image as unit
+            set_costs = np.ones(len(kept_columns)).astype(int)
+
+            # Set up the set cover problem
+            problem = SetCover(dense_projection_matrix, set_costs)
+            # Solve the problem
+            solution_cost, time_used = problem.SolveSCP()
+            print(
+                f"The solution cost is {solution_cost} and solving took {time_used} minutes"
+            )
+
+            # Expand the solution back to a mask over the full set of images
+            selected_images = np.zeros(n_images, dtype=bool)
+            selected_images[kept_columns[np.asarray(problem.s, dtype=bool)]] = True
+        else:
+            # Approximately solve the problem with a greedy algorithm that operates directly on
+            # the sparse matrix, avoiding the expensive densification step
+            selected_images = greedy_set_cover(projection_matrix)
+            print(f"The greedy solution cost is {np.sum(selected_images)}")
 
         # Save out the mask representing the selected images
-        selected_images = problem.s
-        ensure_containing_folder(selected_images_mask_filename)
-        np.save(selected_images_mask_filename, selected_images)
+        save_numpy_atomic(selected_images_mask_filename, selected_images)
 
     if save_selected_images:
-        # Load the camera set
-        camera_set = MetashapeCameraSet(
-            camera_file=cameras_file, image_folder=image_folder
-        )
         # Load the mask identifying the selected cameras
         cameras_mask = np.load(selected_images_mask_filename)
         # Convert it from a boolean mask to indices
@@ -202,6 +295,7 @@ def parse_args():
     parser.add_argument("--selected-images-save-folder")
     parser.add_argument("--downsample-target", default=1.0, type=float)
     parser.add_argument("--min-observations-to-be-included", default=1, type=float)
+    parser.add_argument("--use-exact-set-cover", action="store_true")
     parser.add_argument("--vis", action="store_true")
 
     args = parser.parse_args()
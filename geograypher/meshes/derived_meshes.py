@@ -1,12 +1,16 @@
 import typing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import geopandas as gpd
 import matplotlib.pyplot as plt
 import numpy as np
 import pyproj
+import pyvista as pv
+import shapely
 from scipy.sparse import csr_array
-from shapely import Point
-from sklearn.cluster import KMeans
+from scipy.spatial import cKDTree
+from sklearn.cluster import MiniBatchKMeans
 from tqdm import tqdm
 
 from geograypher.cameras import PhotogrammetryCamera, PhotogrammetryCameraSet
@@ -22,6 +26,15 @@ from geograypher.utils.geospatial import coerce_to_geoframe, ensure_projected_CR
 class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
     """Extends the TexturedPhotogrammtery mesh by allowing chunked operations for large meshes"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Projected camera points cached for the most recent camera set. render_flat and
+        # aggregate_projected_images both route through get_mesh_chunks_for_cameras, so without
+        # the cache the same reprojection of every camera location runs once per entry point.
+        # A single entry is enough for that pattern and avoids pinning every camera set the
+        # mesh has ever been chunked against
+        self.camera_points_cache = None
+
     def get_mesh_chunks_for_cameras(
         self,
         cameras: typing.Union[PhotogrammetryCamera, PhotogrammetryCameraSet],
@@ -29,6 +42,9 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
         buffer_dist_meters: float = CHUNKED_MESH_BUFFER_DIST_METERS,
         vis_clusters: bool = False,
         include_texture: bool = False,
+        prefetch_chunks: bool = False,
+        cluster_method: str = "minibatch",
+        memmap_texture: bool = False,
     ):
         """Return a generator of sub-meshes, chunked to align with clusters of cameras
 
@@ -44,6 +60,23 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
                 Should the location of the cameras and resultant clusters be shown. Defaults to False.
             include_texture (bool, optional): Should the texture from the full mesh be included
                 in the subset mesh. Defaults to False.
+            prefetch_chunks (bool, optional):
+                Extract the next cluster's sub-mesh in a background thread while the caller
+                processes the current one. The extraction is dominated by GEOS and VTK calls that
+                release the GIL, so this overlaps chunking with downstream work such as rendering.
+                Only enable if the consumer is thread-safe with respect to the mesh. Defaults to
+                False.
+            cluster_method (str, optional):
+                How to assign cameras to clusters. "minibatch" runs mini-batch k-means on the
+                camera locations. "grid" buckets the cameras on a regular spatial grid, which
+                needs no distance computations at all but produces less evenly-sized clusters.
+                With "grid" the number of clusters is the number of occupied cells, which may be
+                less than n_clusters. Defaults to "minibatch".
+            memmap_texture (bool, optional):
+                Read the full-mesh texture through a disk-backed memory map so each cluster's
+                gather only pages in the touched face rows, instead of holding a float32 copy of
+                the whole texture in RAM for the duration of the generator. Only relevant with
+                include_texture=True. Defaults to False.
 
         Yields:
             pv.PolyData: The subset mesh
@@ -51,30 +84,73 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
             np.ndarray: The IDs of the faces in the original mesh used to generate the sub mesh
 
         """
-        # Extract the points depending on whether it's a single camera or a set
-        if isinstance(cameras, PhotogrammetryCamera):
-            camera_points = [Point(*cameras.get_lon_lat())]
+        # Check for previously-projected points for this camera set, since the reprojection work
+        # below is identical across repeated calls with the same cameras. The camera set itself
+        # is stored in the entry and compared by identity, which both guards against a stale hit
+        # and keeps the object alive so CPython cannot recycle its id
+        cached_entry = self.camera_points_cache
+        if cached_entry is not None and cached_entry[0] is cameras:
+            _, camera_points, camera_points_numpy = cached_entry
         else:
-            # Get the lat lon for each camera point and turn into a shapely Point
-            camera_points = [
-                Point(*lon_lat) for lon_lat in cameras.get_lon_lat_coords()
-            ]
-
-        # Create a geodataframe from the points
-        camera_points = gpd.GeoDataFrame(
-            geometry=camera_points, crs=pyproj.CRS.from_epsg("4326")
-        )
-        # Make sure the gdf has a gemetric CRS so there is no warping of the space
-        camera_points = ensure_projected_CRS(camera_points)
-        # Extract the x, y points now in a geometric CRS
-        camera_points_numpy = np.stack(
-            camera_points.geometry.apply(lambda point: (point.x, point.y))
-        )
+            # Extract the points depending on whether it's a single camera or a set
+            if isinstance(cameras, PhotogrammetryCamera):
+                lon_lat_coords = np.array([cameras.get_lon_lat()])
+            else:
+                # Get the lat lon for each camera point
+                lon_lat_coords = np.array(cameras.get_lon_lat_coords())
+
+            # Create a geodataframe from the points. points_from_xy builds all the geometries in
+            # one vectorized call rather than constructing a Python Point per camera
+            camera_points = gpd.GeoDataFrame(
+                geometry=gpd.points_from_xy(lon_lat_coords[:, 0], lon_lat_coords[:, 1]),
+                crs=pyproj.CRS.from_epsg("4326"),
+            )
+            # Make sure the gdf has a gemetric CRS so there is no warping of the space
+            camera_points = ensure_projected_CRS(camera_points)
+            # Extract the x, y points now in a geometric CRS. shapely.get_coordinates reads the
+            # coordinates out in one vectorized call rather than a Python loop over points
+            camera_points_numpy = shapely.get_coordinates(
+                camera_points.geometry.to_numpy()
+            )
+            self.camera_points_cache = (
+                cameras,
+                camera_points,
+                camera_points_numpy,
+            )
 
-        # Assign each camera to a cluster
-        camera_cluster_IDs = KMeans(n_clusters=n_clusters).fit_predict(
-            camera_points_numpy
-        )
+        # Assign each camera to a cluster. The clusters are only used to partition the work, not
+        # as a statistical result, so cheap methods are sufficient
+        if cluster_method == "grid":
+            # Bucket the cameras on a regular grid covering their extent, with the per-axis cell
+            # counts chosen to roughly match the aspect ratio of the extent. This is one pass
+            # with no distance math at all
+            min_corner = camera_points_numpy.min(axis=0)
+            spans = np.maximum(camera_points_numpy.max(axis=0) - min_corner, 1e-6)
+            n_cells_x = max(1, int(np.round(np.sqrt(n_clusters * spans[0] / spans[1]))))
+            n_cells_y = max(1, int(np.ceil(n_clusters / n_cells_x)))
+            cell_inds_x = np.minimum(
+                ((camera_points_numpy[:, 0] - min_corner[0]) / spans[0] * n_cells_x),
+                n_cells_x - 1,
+            ).astype(int)
+            cell_inds_y = np.minimum(
+                ((camera_points_numpy[:, 1] - min_corner[1]) / spans[1] * n_cells_y),
+                n_cells_y - 1,
+            ).astype(int)
+            # Remap the occupied cells to dense cluster IDs and update the cluster count to
+            # match, since some cells may be empty
+            _, camera_cluster_IDs = np.unique(
+                cell_inds_x * n_cells_y + cell_inds_y, return_inverse=True
+            )
+            n_clusters = int(camera_cluster_IDs.max()) + 1
+        elif cluster_method == "minibatch":
+            # The cheaper mini-batch variant of k-means is sufficient, float32 coordinates halve
+            # the bandwidth of the distance computations, and a single k-means++ initialization
+            # with a capped iteration count is plenty for a load-balancing partition
+            camera_cluster_IDs = MiniBatchKMeans(
+                n_clusters=n_clusters, batch_size=1024, n_init=1, max_iter=50
+            ).fit_predict(camera_points_numpy.astype(np.float32, copy=False))
+        else:
+            raise ValueError(f"Unrecognized cluster_method: {cluster_method}")
         if vis_clusters:
             # Show the camera locations, colored by which one they were assigned to
             plt.scatter(
@@ -85,32 +161,66 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
             )
             plt.show()
 
-        # Get the texture from the full mesh
-        full_mesh_texture = (
-            self.get_texture(request_vertex_texture=False) if include_texture else None
+        # Get the texture from the full mesh. Casting once to contiguous float32 halves the bytes
+        # copied by the per-cluster fancy-indexed slices, which otherwise re-copy a float64 array.
+        # The memory-mapped variant trades the resident copy for paging in only the rows each
+        # cluster touches; the face IDs are sorted, which keeps those reads mostly sequential
+        full_mesh_texture = None
+        if include_texture:
+            if memmap_texture:
+                full_mesh_texture = self.get_texture_memmap(
+                    request_vertex_texture=False
+                )
+            else:
+                full_mesh_texture = np.ascontiguousarray(
+                    self.get_texture(request_vertex_texture=False), dtype=np.float32
+                )
+
+        # Group the camera indices by cluster once, rather than scanning the full array of cluster
+        # IDs at every iteration. The stable argsort orders the indices by cluster and the cluster
+        # sizes give the boundaries of each contiguous group
+        cluster_order = np.argsort(camera_cluster_IDs, kind="stable")
+        cluster_bounds = np.concatenate(
+            ([0], np.cumsum(np.bincount(camera_cluster_IDs, minlength=n_clusters)))
         )
 
-        # Iterate over the clusters of cameras
-        for cluster_ID in tqdm(range(n_clusters), desc="Chunks in mesh"):
+        # Build a KD-tree over the 2D face centroids, expressed in the same projected CRS as the
+        # camera points. Each cluster's face membership then becomes a radius query against the
+        # tree, rather than a geopandas buffer-and-overlay pass that re-scans the full mesh once
+        # per cluster
+        verts_2d = self.get_vertices_in_CRS(camera_points.crs)[:, :2]
+        face_centroids_2d = verts_2d[self.faces].mean(axis=1)
+        face_centroid_tree = cKDTree(face_centroids_2d)
+
+        def build_chunk(cluster_ID):
             # Get indices of cameras for that cluster
-            matching_camera_inds = np.where(cluster_ID == camera_cluster_IDs)[0]
+            matching_camera_inds = cluster_order[
+                cluster_bounds[cluster_ID] : cluster_bounds[cluster_ID + 1]
+            ]
             # Get the segmentor camera set for the subset of the camera inds
             sub_camera_set = cameras.get_subset_cameras(matching_camera_inds)
-            # Extract the rows in the dataframe for those IDs
-            subset_camera_points = camera_points.iloc[matching_camera_inds]
-
-            # TODO this could be accellerated by computing the membership for all points at the begining.
-            # This would require computing all the ROIs (potentially-overlapping) for each region first. Then, finding all the non-overlapping
-            # partition where each polygon corresponds to a set of ROIs. Then the membership for each vertex could be found for each polygon
-            # and the membership in each ROI could be computed. This should be benchmarked though, because having more polygons than original
-            # ROIs may actually lead to slower computations than doing it sequentially
-
-            # Extract a sub mesh for a region around the camera points and also retain the indices into the original mesh
-            sub_mesh_pv, _, face_IDs = self.select_mesh_ROI(
-                region_of_interest=subset_camera_points,
-                buffer_meters=buffer_dist_meters,
-                return_original_IDs=True,
+
+            # Collect the faces whose centroid is within the buffer distance of any camera in the
+            # cluster, as the union of the per-camera radius queries
+            per_camera_hits = face_centroid_tree.query_ball_point(
+                camera_points_numpy[matching_camera_inds], r=buffer_dist_meters
+            )
+            nonempty_hits = [
+                np.asarray(hits, dtype=int) for hits in per_camera_hits if len(hits) > 0
+            ]
+            face_IDs = (
+                np.unique(np.concatenate(nonempty_hits))
+                if len(nonempty_hits) > 0
+                else np.array([], dtype=int)
             )
+
+            # Extract the sub mesh for those faces directly, skipping the geometric ROI selection
+            if len(face_IDs) > 0:
+                sub_mesh_pv = self.pyvista_mesh.extract_cells(
+                    face_IDs
+                ).extract_surface()
+            else:
+                sub_mesh_pv = pv.PolyData()
             # Extract the corresponding texture elements for this sub mesh if needed
             # If include_texture=False, the full_mesh_texture will not be set
             # If there is no mesh, the texture should also be set to None, otherwise it will be
@@ -128,7 +238,23 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
 
             # Return the submesh as a Textured Photogrammetry Mesh, the subset of cameras, and the
             # face IDs mapping the faces in the sub mesh back to the full one
-            yield sub_mesh_TPM, sub_camera_set, face_IDs
+            return sub_mesh_TPM, sub_camera_set, face_IDs
+
+        if prefetch_chunks and n_clusters > 1:
+            # Producer-consumer pipeline: while the caller processes the current chunk, a single
+            # background thread extracts the next one, hiding one chunk-extraction latency per
+            # iteration
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                next_chunk_future = executor.submit(build_chunk, 0)
+                for cluster_ID in tqdm(range(n_clusters), desc="Chunks in mesh"):
+                    chunk = next_chunk_future.result()
+                    if cluster_ID + 1 < n_clusters:
+                        next_chunk_future = executor.submit(build_chunk, cluster_ID + 1)
+                    yield chunk
+        else:
+            # Iterate over the clusters of cameras
+            for cluster_ID in tqdm(range(n_clusters), desc="Chunks in mesh"):
+                yield build_chunk(cluster_ID)
 
     def render_flat(
         self,
@@ -138,6 +264,7 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
         n_clusters: int = 8,
         buffer_dist_meters: float = CHUNKED_MESH_BUFFER_DIST_METERS,
         vis_clusters: bool = False,
+        prefetch_chunks: bool = False,
         **pix2face_kwargs,
     ):
         """
@@ -161,6 +288,10 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
                 How far around the cameras to include the mesh. Defaults to 50.
             vis_clusters (bool, optional):
                 Should the clusters of camera locations be shown. Defaults to False.
+            prefetch_chunks (bool, optional):
+                Extract the next cluster's sub-mesh in a background thread while the current one
+                is being rendered, so the renderer is not left idle during the CPU-side chunk
+                extraction. Defaults to False.
 
         Raises:
             TypeError: If cameras is not the correct type
@@ -177,6 +308,7 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
             buffer_dist_meters=buffer_dist_meters,
             vis_clusters=vis_clusters,
             include_texture=True,
+            prefetch_chunks=prefetch_chunks,
         )
 
         for sub_mesh_TPM, sub_camera_set, _ in tqdm(
@@ -201,6 +333,8 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
         n_clusters: int = 8,
         buffer_dist_meters: float = CHUNKED_MESH_BUFFER_DIST_METERS,
         vis_clusters: bool = False,
+        n_workers: int = 1,
+        prefetch_chunks: bool = False,
         **kwargs,
     ):
         """
@@ -224,6 +358,16 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
                 locations. Defaults to 250.
             vis_clusters (bool, optional):
                 Should the location of the cameras and resultant clusters be shown. Defaults to False.
+            n_workers (int, optional):
+                The number of threads used to aggregate clusters concurrently. Each cluster is an
+                independent sub-mesh so they can be processed in parallel, with the results merged
+                on the main thread. Note that rendering backends may not be thread-safe, so this
+                defaults to serial execution. Defaults to 1.
+            prefetch_chunks (bool, optional):
+                Extract the next cluster's sub-mesh in a background thread while the current one
+                is aggregated. Useful to overlap chunk extraction with aggregation when n_workers
+                is 1; with n_workers > 1 the worker pool already provides the overlap. Defaults
+                to False.
 
         Returns:
             np.ndarray: (n_faces, n_image_channels) The average projected image per face
@@ -231,11 +375,16 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
                   and potentially each individual projection
         """
 
-        # Initialize the values that will be incremented per cluster
-        summed_projections = np.zeros(
-            (self.pyvista_mesh.n_faces, cameras.n_image_channels()), dtype=float
-        )
-        projection_counts = np.zeros(self.pyvista_mesh.n_faces, dtype=int)
+        # Look up the sizes once rather than going through the pyvista property and the camera
+        # set on every use
+        n_faces = int(self.pyvista_mesh.n_faces)
+        n_image_channels = int(cameras.n_image_channels())
+
+        # Initialize the values that will be incremented per cluster. float32 is plenty of
+        # precision for summed pixel values and halves the bandwidth of this memory-bound
+        # accumulator; the channel axis is already the contiguous inner dimension
+        summed_projections = np.zeros((n_faces, n_image_channels), dtype=np.float32)
+        projection_counts = np.zeros(n_faces, dtype=int)
 
         # Create a generator to generate chunked meshes
         chunk_gen = self.get_mesh_chunks_for_cameras(
@@ -243,15 +392,11 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
             n_clusters=n_clusters,
             buffer_dist_meters=buffer_dist_meters,
             vis_clusters=vis_clusters,
+            prefetch_chunks=(prefetch_chunks and n_workers == 1),
         )
 
-        # Iterate over chunks in the mesh
-        for sub_mesh_TPM, sub_camera_set, face_IDs in chunk_gen:
-            # This means there was no mesh for these cameras
-            if len(face_IDs) == 0:
-                continue
-
-            # Aggregate the projections from a set of cameras corresponding to
+        def aggregate_chunk(sub_mesh_TPM, sub_camera_set):
+            # Aggregate the projections from the set of cameras corresponding to one chunk
             _, additional_information_submesh = sub_mesh_TPM.aggregate_projected_images(
                 sub_camera_set,
                 batch_size=batch_size,
@@ -259,21 +404,59 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
                 return_all=False,
                 **kwargs,
             )
+            return additional_information_submesh
+
+        def merge_chunk(additional_information_submesh, face_IDs):
+            # Increment the summed predictions and counts. The running accumulator is nan-free by
+            # construction, so only the submesh values need their nans zeroed out before they are
+            # scattered in. Doing this in place avoids stacking both sides into a temporary
+            # (2, len(face_IDs), n_channels) array per chunk
+            sub_summed_projections = additional_information_submesh[
+                "summed_projections"
+            ]
+            np.nan_to_num(sub_summed_projections, copy=False)
+            # The face IDs within one chunk are unique (faces shared between clusters arrive in
+            # separate merge calls), so a plain fancy-indexed += is sufficient and avoids the
+            # slower unbuffered scatter of np.add.at
+            summed_projections[face_IDs] += sub_summed_projections
+            projection_counts[face_IDs] += additional_information_submesh[
+                "projection_counts"
+            ]
 
-            # Increment the summed predictions and counts
-            # Make sure that nans don't propogate, since they should just be treated as zeros
-            # TODO ensure this is correct
-            summed_projections[face_IDs] = np.nansum(
-                [
-                    summed_projections[face_IDs],
-                    additional_information_submesh["summed_projections"],
-                ],
-                axis=0,
-            )
-            projection_counts[face_IDs] = (
-                projection_counts[face_IDs]
-                + additional_information_submesh["projection_counts"]
-            )
+        if n_workers > 1:
+            # Dispatch the independent clusters to a thread pool and merge each result on the
+            # main thread. The number of outstanding chunks is bounded so the generator is not
+            # drained up front, which would hold every sub-mesh and camera subset in memory at
+            # once and defeat the point of chunking
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                in_flight = deque()
+                for sub_mesh_TPM, sub_camera_set, face_IDs in chunk_gen:
+                    # This means there was no mesh for these cameras
+                    if len(face_IDs) == 0:
+                        continue
+                    in_flight.append(
+                        (
+                            executor.submit(
+                                aggregate_chunk, sub_mesh_TPM, sub_camera_set
+                            ),
+                            face_IDs,
+                        )
+                    )
+                    # Once the window is full, merge the oldest chunk before extracting another
+                    if len(in_flight) > n_workers:
+                        future, merge_face_IDs = in_flight.popleft()
+                        merge_chunk(future.result(), merge_face_IDs)
+                # Drain the remaining in-flight chunks
+                while in_flight:
+                    future, merge_face_IDs = in_flight.popleft()
+                    merge_chunk(future.result(), merge_face_IDs)
+        else:
+            # Iterate over chunks in the mesh
+            for sub_mesh_TPM, sub_camera_set, face_IDs in chunk_gen:
+                # This means there was no mesh for these cameras
+                if len(face_IDs) == 0:
+                    continue
+                merge_chunk(aggregate_chunk(sub_mesh_TPM, sub_camera_set), face_IDs)
 
         # Same as the parent class
         no_projections = projection_counts == 0
@@ -284,9 +467,15 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
             "summed_projections": summed_projections,
         }
 
-        average_projections = np.divide(
-            summed_projections, np.expand_dims(projection_counts, 1)
+        # Normalize with a reciprocal multiply in float32, computed only for observed faces, to
+        # match the parent class. Unobserved rows are already nan and stay nan
+        reciprocal_counts = np.zeros(projection_counts.shape, dtype=np.float32)
+        observed_faces = np.logical_not(no_projections)
+        reciprocal_counts[observed_faces] = np.reciprocal(
+            projection_counts[observed_faces].astype(np.float32)
         )
+        average_projections = summed_projections.astype(np.float32)
+        average_projections *= np.expand_dims(reciprocal_counts, 1)
 
         return average_projections, additional_information
 
@@ -341,24 +530,35 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
         """
         # Load in the polygons
         polygons_gdf = ensure_projected_CRS(coerce_to_geoframe(polygons))
-        # Extract the centroid of each one and convert to a numpy array
-        centroids_xy = np.stack(
-            polygons_gdf.centroid.apply(lambda point: (point.x, point.y))
-        )
+        # Extract the centroid of each one and convert to a numpy array in one vectorized call
+        centroids_xy = shapely.get_coordinates(polygons_gdf.centroid.to_numpy())
         # Determine how many clusters there should be
         n_clusters = int(np.ceil(len(polygons_gdf) / n_polygons_per_cluster))
-        # Assign each polygon to a cluster
-        polygon_cluster_IDs = KMeans(n_clusters=n_clusters).fit_predict(centroids_xy)
+        # Assign each polygon to a cluster, using the cheap mini-batch variant since the clusters
+        # just partition the work
+        polygon_cluster_IDs = MiniBatchKMeans(
+            n_clusters=n_clusters, batch_size=1024, n_init=1, max_iter=50
+        ).fit_predict(centroids_xy.astype(np.float32, copy=False))
 
         # This will be set later once we figure out the datatype of the per-cluster labels
         all_labels = None
 
+        # Group the polygon indices by cluster once instead of scanning the cluster IDs at every
+        # iteration. The stable argsort orders the indices by cluster and the cluster sizes give
+        # the boundaries of each contiguous group
+        cluster_order = np.argsort(polygon_cluster_IDs, kind="stable")
+        cluster_bounds = np.concatenate(
+            ([0], np.cumsum(np.bincount(polygon_cluster_IDs, minlength=n_clusters)))
+        )
+
         # Loop over the individual clusters
         for cluster_ID in tqdm(range(n_clusters), desc="Clusters of polygons"):
             # Determine which polygons are part of that cluster
-            cluster_mask = polygon_cluster_IDs == cluster_ID
+            cluster_inds = cluster_order[
+                cluster_bounds[cluster_ID] : cluster_bounds[cluster_ID + 1]
+            ]
             # Extract the polygons from one cluster
-            cluster_polygons = polygons_gdf.iloc[cluster_mask]
+            cluster_polygons = polygons_gdf.iloc[cluster_inds]
             # Compute the labeling per polygon
             cluster_labels = super().label_polygons(
                 face_labels,
@@ -378,7 +578,7 @@ class TexturedPhotogrammetryMeshChunked(TexturedPhotogrammetryMesh):
                 all_labels = np.zeros(len(polygons_gdf), dtype=cluster_labels.dtype)
 
             # Set the appropriate elements of the full array with the newly-computed cluster labels
-            all_labels[cluster_mask] = cluster_labels
+            all_labels[cluster_inds] = cluster_labels
 
         # The output is expected to be a list
         all_labels = all_labels.tolist()
@@ -426,10 +626,11 @@ class TexturedPhotogrammetryMeshIndexPredictions(TexturedPhotogrammetryMesh):
         if return_all:
             all_projections = []
 
-        # Initialize sparse arrays for number of projections per face and the summed projections
-        # TODO this datatype may need to be changed in the future
-        projection_counts = csr_array((n_faces, 1), dtype=int)
-        summed_projections = csr_array((n_faces, n_classes), dtype=int)
+        # The summed projections are accumulated as streaming COO buffers of (face, class)
+        # coordinates and only built into a sparse array once at the end, so no per-view sparse
+        # restructuring is needed. The per-face counts are derived from the same buffers
+        summed_rows = []
+        summed_cols = []
 
         # Create a generator for all the projections
         project_images_generator = self.project_images(
@@ -450,48 +651,48 @@ class TexturedPhotogrammetryMeshIndexPredictions(TexturedPhotogrammetryMesh):
             if return_all:
                 all_projections.append(projection_for_image)
 
-            # Determine which pixels in the image have non-null projections
-            projected_face_inds = np.nonzero(
-                np.isfinite(np.squeeze(projection_for_image))
-            )[0]
+            # Extract the single channel of per-face values and compute the finite mask once, so
+            # both the face indices and the class values are derived from the same pass over the
+            # data rather than re-scanning the array for each
+            projection_values = projection_for_image[:, 0]
+            finite_mask = np.isfinite(projection_values)
+            projected_face_inds = np.nonzero(finite_mask)[0]
 
             # If there's no projected classes, this is just wasted compute and also can cause errors
             # because indexing with an empty array returns all values
             if len(projected_face_inds) == 0:
                 continue
 
-            # Create an array for faces which were projected to by this image
-            new_projection_counts = csr_array(
-                (
-                    np.ones_like(projected_face_inds, dtype=np.uint16),
-                    (
-                        projected_face_inds,
-                        np.zeros_like(projected_face_inds, dtype=np.uint16),
-                    ),
-                ),
-                shape=(n_faces, 1),
+            # Determine the classes for each non-null projection. The boolean mask reads the
+            # values in a single sequential sweep instead of a gather through the index array
+            projected_face_classes = projection_values[finite_mask].astype(np.int32)
+
+            # Record the (face, class) vote coordinates from this image. int32 comfortably indexes
+            # any realistic face or class count and halves the buffered coordinate memory
+            summed_rows.append(projected_face_inds.astype(np.int32))
+            summed_cols.append(projected_face_classes)
+
+        # Build the sparse summed projections in one shot. Any duplicate (face, class) pairs,
+        # within or across images, are summed by the COO-to-CSR conversion in compiled code
+        if len(summed_rows) > 0:
+            all_rows = np.concatenate(summed_rows)
+            all_cols = np.concatenate(summed_cols)
+            # uint32 data halves the memory of the default 64-bit integers while still supporting
+            # over four billion observations per (face, class) pair
+            summed_projections = csr_array(
+                (np.ones_like(all_rows, dtype=np.uint32), (all_rows, all_cols)),
+                shape=(n_faces, n_classes),
             )
-            # Add this to the running tally variable
-            projection_counts = projection_counts + new_projection_counts
-
-            # Determine the classes for each non-null projection
-            projected_face_classes = projection_for_image[
-                projected_face_inds, 0
-            ].astype(int)
-
-            # Find the current value for the summed projection for given face, class pairs
-            old_values_for_projected_elements = summed_projections[
-                projected_face_inds, projected_face_classes
-            ]
-            # Increment the previous value by one
-            incremented_old_values_for_projected_elements = (
-                old_values_for_projected_elements + 1
-            )
-
-            # Set the running tally to the updated value
-            summed_projections[projected_face_inds, projected_face_classes] = (
-                incremented_old_values_for_projected_elements
+            # Each face index appears at most once per image, so a bincount over the concatenated
+            # buffers gives the number of images observing each face in one O(total_votes) pass
+            projection_counts = csr_array(
+                np.expand_dims(
+                    np.bincount(all_rows, minlength=n_faces).astype(np.uint32), 1
+                )
             )
+        else:
+            summed_projections = csr_array((n_faces, n_classes), dtype=np.uint32)
+            projection_counts = csr_array((n_faces, 1), dtype=np.uint32)
 
         # Record the information
         additional_information = {
@@ -503,23 +704,18 @@ class TexturedPhotogrammetryMeshIndexPredictions(TexturedPhotogrammetryMesh):
 
         # Perform the normalization by the counts
         # We can't do per-element division of sparse matrices so instead we just take the reciprocal
-        # of each count and then multiply it these values by the summed projections
-        # https://stackoverflow.com/questions/21080430/taking-reciprocal-of-each-elements-in-a-sparse-matrix
-        # Since np.reciprocal doesn't handle integer values, it is important to cast the data to float
-        projection_counts_reciprocal = csr_array(
-            (
-                (
-                    np.reciprocal(
-                        projection_counts.data.astype(float),
-                    ),
-                    projection_counts.indices,
-                    projection_counts.indptr,
-                )
-            ),
-            shape=projection_counts.shape,
-        )
+        # of each count and then multiply it these values by the summed projections. A dense
+        # (n_faces, 1) column of counts is small relative to the (n_faces, n_classes) projections,
+        # so expanding it avoids rebuilding and re-validating a sparse matrix just to hold the
+        # reciprocals
+        projection_counts_dense = projection_counts.todense().astype(float)
+        # Unobserved faces have no stored projection entries, so the value multiplied into their
+        # rows is irrelevant; setting the count to one avoids a divide-by-zero warning
+        projection_counts_dense[projection_counts_dense == 0] = 1
         # Normalize the summed projection by the number of observations for that face
-        average_projections = summed_projections.multiply(projection_counts_reciprocal)
+        average_projections = summed_projections.multiply(
+            np.reciprocal(projection_counts_dense)
+        )
 
         return average_projections, additional_information
 
@@ -563,10 +759,41 @@ class TexturedPhotogrammetryMeshPyTorch3dRendering(TexturedPhotogrammetryMesh):
         else:
             self.device = torch.device("cpu")
 
+        # Cached on-device copies of the mesh geometry, populated lazily by
+        # create_pytorch3d_mesh. The pyvista mesh they were built from is kept so the cache is
+        # invalidated if the mesh object is replaced; holding the object itself rather than its
+        # id avoids a stale hit if the id is recycled after garbage collection
+        self.cached_verts_tensor = None
+        self.cached_faces_tensor = None
+        self.cached_geometry_mesh = None
+        # Rasterizers cached per rasterization configuration, since rebuilding them per call
+        # churns Python objects across thousands of camera batches
+        self.rasterizer_cache = {}
+
+    def to_device_tensor(self, array: np.ndarray, dtype):
+        """Upload a numpy array to the device with at most one host-side copy
+
+        torch.from_numpy shares memory with the (contiguous, correctly-typed) numpy array rather
+        than copying it, and staging through pinned memory lets the device transfer run
+        asynchronously via DMA.
+
+        Args:
+            array (np.ndarray): The array to upload
+            dtype: The numpy dtype the tensor should have
+
+        Returns:
+            torch.Tensor: The tensor on self.device
+        """
+        host_tensor = self.torch.from_numpy(np.ascontiguousarray(array, dtype=dtype))
+        if self.device.type == "cuda":
+            host_tensor = host_tensor.pin_memory()
+        return host_tensor.to(self.device, non_blocking=True)
+
     def create_pytorch3d_mesh(
         self,
         vert_texture: np.ndarray = None,
         batch_size: int = 1,
+        face_subset_inds=None,
     ):
         """Create the pytorch_3d_mesh
 
@@ -575,26 +802,43 @@ class TexturedPhotogrammetryMeshPyTorch3dRendering(TexturedPhotogrammetryMesh):
                 Optional texture, (n_verts, n_channels). In the range [0, 1]. Defaults to None.
             batch_size (int):
                 Number of copies of the mesh to create in a batch. Defaults to 1.
+            face_subset_inds (torch.Tensor, optional):
+                If set, only include these faces of the mesh. The vertices are left unchanged so
+                vertex textures remain valid. Defaults to None.
         """
 
         # Create the texture object if provided
         if vert_texture is not None:
-            vert_texture = (
-                self.torch.Tensor(vert_texture)
-                .to(self.torch.float)
-                .to(self.device)
-                .unsqueeze(0)
-            )
+            vert_texture = self.to_device_tensor(
+                vert_texture, dtype=np.float32
+            ).unsqueeze(0)
             if len(vert_texture.shape) == 2:
                 vert_texture = vert_texture.unsqueeze(-1)
             texture = self.TexturesVertex(verts_features=vert_texture).to(self.device)
         else:
             texture = None
 
+        # The geometry is immutable between calls, so upload the vertices and faces to the device
+        # once and reuse the cached tensors on subsequent calls rather than paying a full
+        # host-to-device copy of the mesh per batch
+        if self.cached_geometry_mesh is not self.pyvista_mesh:
+            self.cached_verts_tensor = self.to_device_tensor(
+                self.verts, dtype=np.float32
+            )
+            self.cached_faces_tensor = self.to_device_tensor(self.faces, dtype=np.int64)
+            self.cached_geometry_mesh = self.pyvista_mesh
+
+        # Optionally restrict to a subset of the faces
+        faces_tensor = (
+            self.cached_faces_tensor
+            if face_subset_inds is None
+            else self.cached_faces_tensor[face_subset_inds]
+        )
+
         # Create the pytorch mesh
         pytorch3d_mesh = self.Meshes(
-            verts=[self.torch.Tensor(self.pyvista_mesh.points).to(self.device)],
-            faces=[self.torch.Tensor(self.faces).to(self.device)],
+            verts=[self.cached_verts_tensor],
+            faces=[faces_tensor],
             textures=texture,
         ).to(self.device)
 
@@ -611,6 +855,13 @@ class TexturedPhotogrammetryMeshPyTorch3dRendering(TexturedPhotogrammetryMesh):
         save_to_cache: bool = False,
         cache_folder: typing.Union[None, PATH_TYPE] = CACHE_FOLDER,
         cull_to_frustum: bool = False,
+        cull_backfaces: bool = False,
+        faces_per_pixel: int = 1,
+        bin_size: typing.Union[int, None] = None,
+        max_faces_per_bin: typing.Union[int, None] = None,
+        perspective_correct: bool = False,
+        rasterizer_backend: str = "cuda",
+        precull_faces: bool = False,
     ) -> np.ndarray:
         """Use pytorch3d to get correspondences between pixels and vertices
 
@@ -631,6 +882,35 @@ class TexturedPhotogrammetryMeshPyTorch3dRendering(TexturedPhotogrammetryMesh):
             cull_to_frustum (bool, optional):
                 If True, enables frustum culling to exclude mesh faces outside the camera's view,
                 Defaults to False.
+            cull_backfaces (bool, optional):
+                Skip rasterizing faces that point away from the camera. Only enable this if the
+                mesh has consistent triangle winding, otherwise valid faces are dropped.
+                Defaults to False.
+            faces_per_pixel (int, optional):
+                The number of nearest faces to record per pixel. Only the nearest face is needed
+                for pixel-to-face correspondences, so larger values just add priority-queue work.
+                Defaults to 1.
+            bin_size (typing.Union[int, None], optional):
+                The bin size for the coarse-to-fine rasterizer. None lets pytorch3d choose a
+                reasonable value, while 0 forces the slower naive rasterizer. Defaults to None.
+            max_faces_per_bin (typing.Union[int, None], optional):
+                The maximum number of faces per bin for the coarse-to-fine rasterizer. Raise this
+                if pytorch3d warns about bin overflow on dense meshes. None lets pytorch3d choose.
+                Defaults to None.
+            perspective_correct (bool, optional):
+                Use perspective-correct interpolation of the barycentric coordinates. Only the
+                nearest face index is used here, so the extra per-pixel work is unnecessary.
+                Defaults to False.
+            rasterizer_backend (str, optional):
+                Which rasterizer to use, "cuda" or "opengl". The OpenGL rasterizer uses the
+                hardware fixed-function pipeline and can be substantially faster on large meshes
+                since no gradients are needed here, but requires a pytorch3d build with OpenGL
+                support. Defaults to "cuda".
+            precull_faces (bool, optional):
+                Before rasterizing, drop faces whose centroids project outside the view frustum of
+                every camera in the batch. For aerial imagery each camera typically observes a
+                small fraction of the mesh, so this proportionally reduces rasterizer work and
+                memory. The returned face indices still refer to the full mesh. Defaults to False.
 
         Returns:
             np.ndarray: For each camera, returns an array of face indices corresponding to each pixel
@@ -647,49 +927,132 @@ class TexturedPhotogrammetryMeshPyTorch3dRendering(TexturedPhotogrammetryMesh):
             p3d_cameras = self.transform_into_pytorch3d_camera_set(cameras=cameras)
             image_size = cameras[0].get_image_size(image_scale=render_img_scale)
 
-        raster_settings = self.RasterizationSettings(
-            image_size=image_size,
-            blur_radius=0.0,
-            faces_per_pixel=1,
-            cull_to_frustum=cull_to_frustum,
+        # The settings and rasterizer only depend on the rasterization configuration, not the
+        # cameras, so build them once per configuration and reuse them across calls. The cameras
+        # are supplied at rasterization time instead
+        raster_key = (
+            tuple(image_size),
+            cull_to_frustum,
+            cull_backfaces,
+            faces_per_pixel,
+            bin_size,
+            max_faces_per_bin,
+            perspective_correct,
+            rasterizer_backend,
         )
+        if raster_key not in self.rasterizer_cache:
+            raster_settings = self.RasterizationSettings(
+                image_size=image_size,
+                blur_radius=0.0,
+                faces_per_pixel=faces_per_pixel,
+                bin_size=bin_size,
+                max_faces_per_bin=max_faces_per_bin,
+                perspective_correct=perspective_correct,
+                cull_to_frustum=cull_to_frustum,
+                cull_backfaces=cull_backfaces,
+            )
 
-        # Don't wrap this in a MeshRenderer like normal because we need intermediate results
-        rasterizer = self.MeshRasterizer(
-            cameras=p3d_cameras, raster_settings=raster_settings
-        ).to(self.device)
+            if rasterizer_backend == "opengl":
+                try:
+                    from pytorch3d.renderer.opengl import MeshRasterizerOpenGL
+                except ImportError:
+                    raise ImportError(
+                        "This pytorch3d build does not provide the OpenGL rasterizer. Please use rasterizer_backend='cuda' instead."
+                    )
+                rasterizer_class = MeshRasterizerOpenGL
+            elif rasterizer_backend == "cuda":
+                rasterizer_class = self.MeshRasterizer
+            else:
+                raise ValueError(
+                    f"rasterizer_backend must be 'cuda' or 'opengl' but was {rasterizer_backend}"
+                )
 
-        # Create a pytorch3d mesh
-        pytorch3d_mesh = self.create_pytorch3d_mesh(batch_size=len(p3d_cameras))
+            # Don't wrap this in a MeshRenderer like normal because we need intermediate results
+            self.rasterizer_cache[raster_key] = rasterizer_class(
+                raster_settings=raster_settings
+            ).to(self.device)
+        rasterizer = self.rasterizer_cache[raster_key]
+
+        kept_face_inds_numpy = None
+        if precull_faces:
+            # Project the face centroids into every camera in the batch and keep only faces that
+            # land inside at least one view frustum, so the rasterizer never touches the rest
+            face_centroids = self.torch.from_numpy(
+                np.mean(self.verts[self.faces], axis=1).astype(np.float32)
+            ).to(self.device)
+            # These cameras are defined in screen space (in_ndc=False), so plain transform_points
+            # would return pixel coordinates. Ask for NDC explicitly so the frustum bound below
+            # is meaningful
+            with self.torch.no_grad():
+                ndc_points = p3d_cameras.transform_points_ndc(face_centroids)
+            if ndc_points.dim() == 2:
+                ndc_points = ndc_points.unsqueeze(0)
+            # For non-square images the NDC range of the long axis extends past one, so bound both
+            # axes by the aspect ratio. The additional margin keeps faces whose centroid is just
+            # outside the frustum but whose area may still be visible
+            ndc_bound = 1.1 * max(image_size) / min(image_size)
+            in_view = (
+                (ndc_points[..., 0].abs() <= ndc_bound)
+                & (ndc_points[..., 1].abs() <= ndc_bound)
+                & (ndc_points[..., 2] > 0)
+            )
+            kept_face_inds = self.torch.nonzero(in_view.any(dim=0)).squeeze(1)
+            # If no faces are visible, skip rasterization entirely
+            if kept_face_inds.shape[0] == 0:
+                return np.full((len(p3d_cameras),) + tuple(image_size), -1, dtype=int)
+            kept_face_inds_numpy = kept_face_inds.cpu().numpy()
+            # Create a pytorch3d mesh containing only the potentially-visible faces
+            pytorch3d_mesh = self.create_pytorch3d_mesh(
+                batch_size=len(p3d_cameras), face_subset_inds=kept_face_inds
+            )
+            n_rasterized_faces = len(kept_face_inds_numpy)
+        else:
+            # Create a pytorch3d mesh
+            pytorch3d_mesh = self.create_pytorch3d_mesh(batch_size=len(p3d_cameras))
+            n_rasterized_faces = self.pyvista_mesh.n_faces
 
         # Perform the expensive pytorch3d operation
-        fragments = rasterizer(pytorch3d_mesh)
-
-        # Extract pix_to_face from fragments, move it to the CPU, and convert tensor to NumPy array
-        pix_to_face = fragments.pix_to_face.cpu().numpy()
-
-        # Removes last dimension which is number of faces that can corrrespond to pixel
-        # pix_to_face now is (batch_size, height, width)
-        pix_to_face = pix_to_face[:, :, :, 0]
+        fragments = rasterizer(pytorch3d_mesh, cameras=p3d_cameras)
+
+        # Only the nearest face per pixel is needed, so drop the faces_per_pixel dimension while
+        # the tensor is still on the device. pix_to_face is now (batch_size, height, width)
+        pix_to_face = fragments.pix_to_face[..., 0]
+
+        # Move the result to the CPU and convert the tensor to a NumPy array. When coming from the
+        # GPU, stage it through pinned host memory with an asynchronous copy so the transfer can
+        # overlap any remaining device work from the rasterizer
+        if pix_to_face.is_cuda:
+            host_pix_to_face = self.torch.empty(
+                pix_to_face.shape, dtype=pix_to_face.dtype, pin_memory=True
+            )
+            host_pix_to_face.copy_(pix_to_face, non_blocking=True)
+            # Wait for the copy to finish before the buffer is handed to NumPy
+            self.torch.cuda.synchronize()
+            pix_to_face = host_pix_to_face.numpy()
+        else:
+            pix_to_face = pix_to_face.numpy()
 
-        # Create an array mask to note where pix_to_face correspondances are -1 (invalid)
-        invalid_mask = pix_to_face == -1
+        # Create an array mask to note where pix_to_face correspondances are valid (not -1)
+        valid_mask = pix_to_face != -1
 
         # Track batch index offset to account for mesh extension
         offset_array = np.arange(
             0,
-            self.pyvista_mesh.n_faces * pix_to_face.shape[0],
-            self.pyvista_mesh.n_faces,
+            n_rasterized_faces * pix_to_face.shape[0],
+            n_rasterized_faces,
         )
 
         # Convert dimensions of offset_array from (batch_size,) to (batch_size, 1, 1) in order to match pix_to_face dimensions
         offset_array = np.expand_dims(offset_array, (1, 2))
 
-        # Adjust pix_to_face indices based on the batch offset
-        pix_to_face = pix_to_face - offset_array
+        # Adjust pix_to_face indices based on the batch offset, writing in place and only where
+        # the correspondence is valid. The -1 sentinels are never touched, so this is one masked
+        # pass instead of a full subtraction followed by rewriting the invalid entries
+        np.subtract(pix_to_face, offset_array, out=pix_to_face, where=valid_mask)
 
-        # Add -1 (invalid) values back into pix_to_face
-        pix_to_face[invalid_mask] = -1
+        # If culling was applied, map indices into the culled face list back to the full mesh
+        if kept_face_inds_numpy is not None:
+            pix_to_face[valid_mask] = kept_face_inds_numpy[pix_to_face[valid_mask]]
 
         return pix_to_face
 
@@ -706,14 +1069,12 @@ class TexturedPhotogrammetryMeshPyTorch3dRendering(TexturedPhotogrammetryMesh):
         # Retrieve intrinsic camera properties
         camera_properties = camera.get_camera_properties()
 
-        rotation_about_z = np.array(
-            [[-1, 0, 0, 0], [0, -1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
-        )
-        # Rotate about the Z axis because the NDC coordinates are defined X: left, Y: up and we use X: right, Y: down
+        # Rotate about the Z axis because the NDC coordinates are defined X: left, Y: up and we use
+        # X: right, Y: down. The rotation matrix is diag(-1, -1, 1, 1), so premultiplying by it
+        # just negates the first two rows; do that directly instead of a 4x4 matmul
         # See https://pytorch3d.org/docs/cameras
-        transform_4x4_world_to_cam = (
-            rotation_about_z @ camera_properties["world_to_cam_transform"]
-        )
+        transform_4x4_world_to_cam = camera_properties["world_to_cam_transform"].copy()
+        transform_4x4_world_to_cam[:2] *= -1
 
         R = self.torch.Tensor(
             np.expand_dims(transform_4x4_world_to_cam[:3, :3].T, axis=0)
@@ -761,25 +1122,59 @@ class TexturedPhotogrammetryMeshPyTorch3dRendering(TexturedPhotogrammetryMesh):
         Returns:
             pytorch3d.renderer.PerspectiveCameras:
         """
-        # Get the pytorch3d cameras for each of the cameras in the set
-        p3d_cameras = [self.get_single_pytorch3d_camera(camera) for camera in cameras]
-        # Get the image sizes
-        image_sizes = [camera.image_size.cpu().numpy() for camera in p3d_cameras]
+        # Gather the properties of every camera once
+        all_camera_properties = [camera.get_camera_properties() for camera in cameras]
+
         # Check that all the image sizes are the same because this is required for proper batched rendering
-        if np.any([image_size != image_sizes[0] for image_size in image_sizes]):
+        image_sizes = {
+            (properties["image_height"], properties["image_width"])
+            for properties in all_camera_properties
+        }
+        if len(image_sizes) != 1:
             raise ValueError("Not all cameras have the same image size")
+        image_size = image_sizes.pop()
+
+        # Stack the world-to-camera transforms into one (n_cameras, 4, 4) array and apply the
+        # rotation about the Z axis to all of them, since the NDC coordinates are defined
+        # X: left, Y: up while we use X: right, Y: down. The rotation matrix is diag(-1, -1, 1, 1),
+        # so premultiplying by it just negates the first two rows of every transform; do that with
+        # one in-place scale on the freshly-stacked array instead of a broadcast matmul.
+        # See https://pytorch3d.org/docs/cameras
+        world_to_cam_transforms = np.stack(
+            [
+                properties["world_to_cam_transform"]
+                for properties in all_camera_properties
+            ],
+            axis=0,
+        )
+        world_to_cam_transforms[:, :2] *= -1
+
+        # Slice out the batched rotation and translation components. Building each tensor with a
+        # single host-to-device upload avoids one small tensor construction and copy per camera
+        R_batch = world_to_cam_transforms[:, :3, :3].transpose(0, 2, 1)
+        T_batch = world_to_cam_transforms[:, :3, 3]
+        # These parameters are in screen (pixel) coordinates
+        focal_lengths = np.array(
+            [properties["focal_length"] for properties in all_camera_properties]
+        )
+        principal_points = np.array(
+            [
+                (
+                    properties["image_width"] / 2 + properties["principal_point_x"],
+                    properties["image_height"] / 2 + properties["principal_point_y"],
+                )
+                for properties in all_camera_properties
+            ]
+        )
+
         # Create the new pytorch3d cameras object with the information from each camera
         cameras = self.PerspectiveCameras(
-            R=self.torch.cat([camera.R for camera in p3d_cameras], 0),
-            T=self.torch.cat([camera.T for camera in p3d_cameras], 0),
-            focal_length=self.torch.cat(
-                [camera.focal_length for camera in p3d_cameras], 0
-            ),
-            principal_point=self.torch.cat(
-                [camera.get_principal_point() for camera in p3d_cameras], 0
-            ),
+            R=self.to_device_tensor(R_batch, dtype=np.float32),
+            T=self.to_device_tensor(T_batch, dtype=np.float32),
+            focal_length=self.to_device_tensor(focal_lengths, dtype=np.float32),
+            principal_point=self.to_device_tensor(principal_points, dtype=np.float32),
             device=self.device,
             in_ndc=False,  # screen coords
-            image_size=image_sizes[0],
+            image_size=(image_size,),
         )
         return cameras
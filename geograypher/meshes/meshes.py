@@ -1,8 +1,12 @@
 import hashlib
 import json
 import logging
+import os
 import sys
+import tempfile
 import typing
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import time
 
@@ -41,6 +45,7 @@ from geograypher.utils.geospatial import (
     coerce_to_geoframe,
     ensure_non_overlapping_polygons,
     ensure_projected_CRS,
+    get_cached_transformer,
     get_projected_CRS,
 )
 from geograypher.utils.indexing import ensure_float_labels
@@ -86,6 +91,11 @@ class TexturedPhotogrammetryMesh:
         self.pix2face_plotter = create_pv_plotter(off_screen=True)
         self.face_polygons_cache = {}
         self.face_2d_3d_ratios_cache = {}
+        self.verts_gdf_cache = {}
+        # Backing file for the memory-mapped texture, built lazily and reused across calls
+        self.texture_memmap_cache = None
+        # Sorted (vertex, face) incidence pairs, built lazily since it only depends on topology
+        self.vert_face_adjacency_cache = None
 
         self.logger = logging.getLogger(f"mesh_{id(self)}")
         self.logger.setLevel(log_level)
@@ -154,6 +164,9 @@ class TexturedPhotogrammetryMesh:
             # TODO see if pytorch3d has faster/more flexible readers. I'd assume no, but it's good to check
             self.logger.info("Reading the mesh")
             self.pyvista_mesh = pv.read(mesh)
+        # Keep the cached vertex view valid from the moment the mesh exists, since the ROI
+        # selection below reads the vertices through it
+        self.verts = np.asarray(self.pyvista_mesh.points)
 
         self.logger.info("Selecting an ROI from mesh")
         # Select a region of interest if needed
@@ -162,21 +175,39 @@ class TexturedPhotogrammetryMesh:
             buffer_meters=ROI_buffer_meters,
             simplify_tol_meters=ROI_simplify_tol_meters,
         )
+        # Refresh the vertex view since cropping may have replaced the mesh
+        self.verts = np.asarray(self.pyvista_mesh.points)
 
         # Downsample mesh and transfer active scalars from original mesh to downsampled mesh
         if downsample_target != 1.0:
-            # TODO try decimate_pro and compare quality and runtime
             # TODO see if there's a way to preserve the mesh colors
-            # TODO also see this decimation algorithm: https://pyvista.github.io/fast-simplification/
             self.logger.info("Downsampling the mesh")
             # Have a temporary mesh so we can use the original mesh to transfer the active scalars to the downsampled one
-            downsampled_mesh_without_textures = self.pyvista_mesh.decimate(
-                target_reduction=(1 - downsample_target)
-            )
+            try:
+                # fast-simplification implements the same quadric decimation as VTK in
+                # multithreaded C++ and is dramatically faster on large meshes
+                # https://pyvista.github.io/fast-simplification/
+                import fast_simplification
+
+                downsampled_mesh_without_textures = fast_simplification.simplify_mesh(
+                    self.pyvista_mesh, target_reduction=(1 - downsample_target)
+                )
+            except ImportError:
+                self.logger.warning(
+                    "fast-simplification is not installed, falling back to the slower VTK decimation"
+                )
+                downsampled_mesh_without_textures = self.pyvista_mesh.decimate(
+                    target_reduction=(1 - downsample_target)
+                )
             self.pyvista_mesh = self.transfer_texture(downsampled_mesh_without_textures)
         self.logger.info("Extracting faces from mesh")
         # See here for format: https://github.com/pyvista/pyvista-support/issues/96
         self.faces = self.pyvista_mesh.faces.reshape((-1, 4))[:, 1:4].copy()
+        # Point the cached vertex view at the final mesh, so the hot paths read the vertices
+        # without going through the VTK-wrapping .points property every time
+        self.verts = np.asarray(self.pyvista_mesh.points)
+        # The topology just changed, so any previously-built adjacency is stale
+        self.vert_face_adjacency_cache = None
 
     def transfer_texture(self, downsampled_mesh):
         """Transfer texture from original mesh to a downsampled version using KDTree for nearest neighbor point searches
@@ -310,6 +341,56 @@ class TexturedPhotogrammetryMesh:
                     "Face texture not present and conversion was not requested"
                 )
 
+    def get_texture_memmap(
+        self,
+        request_vertex_texture: typing.Union[bool, None] = None,
+        cache_folder: PATH_TYPE = CACHE_FOLDER,
+    ) -> np.ndarray:
+        """Return a read-only memory-mapped view of the texture
+
+        The texture is written to the cache folder once in float32 and re-opened with
+        mmap_mode="r", so gathers against the returned array only page in the rows they touch
+        rather than requiring the full (n_faces, n_channels) array to stay resident. This is
+        useful for chunked processing of meshes whose textures rival available RAM. Note that
+        writing the backing file materializes a full float32 copy of the texture in RAM, so the
+        memory benefit only applies to later use of the returned view. The backing file is
+        reused across calls as long as the texture is unchanged and is deleted when the mesh is
+        garbage collected or the interpreter exits.
+
+        Args:
+            request_vertex_texture (typing.Union[bool, None], optional):
+                See get_texture. Defaults to None.
+            cache_folder (PATH_TYPE, optional):
+                Where to store the backing file. Defaults to CACHE_FOLDER.
+
+        Returns:
+            np.ndarray: The read-only memory-mapped texture array
+        """
+        texture = self.get_texture(request_vertex_texture=request_vertex_texture)
+        # Reuse the existing backing file if it was built from this exact texture array
+        cached_entry = self.texture_memmap_cache
+        if cached_entry is not None and cached_entry[0] is texture:
+            return cached_entry[1]
+        if cached_entry is not None:
+            # The texture was replaced, so drop the stale backing file now rather than letting
+            # it sit on disk until the mesh is garbage collected
+            cached_entry[2]()
+
+        ensure_folder(cache_folder)
+        # Let tempfile pick a unique name, since object ids can be recycled across processes
+        file_descriptor, backing_file = tempfile.mkstemp(
+            prefix="texture_memmap_", suffix=".npy", dir=cache_folder
+        )
+        # float32 halves the on-disk footprint and the bytes paged back in
+        with os.fdopen(file_descriptor, "wb") as file_object:
+            np.save(file_object, np.asarray(texture, dtype=np.float32))
+        # Remove the backing file once the mesh is garbage collected or at interpreter exit, so
+        # repeated runs don't accumulate orphaned multi-gigabyte files in the cache folder
+        cleanup = weakref.finalize(self, os.remove, backing_file)
+        texture_memmap = np.load(backing_file, mmap_mode="r")
+        self.texture_memmap_cache = (texture, texture_memmap, cleanup)
+        return texture_memmap
+
     def is_discrete_texture(self):
         return self.IDs_to_labels is not None
 
@@ -349,7 +430,7 @@ class TexturedPhotogrammetryMesh:
             # Check that the number of matches face or verts
             n_values = texture_array.shape[0]
             n_faces = self.faces.shape[0]
-            n_verts = self.pyvista_mesh.points.shape[0]
+            n_verts = self.verts.shape[0]
 
             if n_verts == n_faces:
                 raise ValueError(
@@ -562,13 +643,27 @@ class TexturedPhotogrammetryMesh:
         ROI_gpd = ROI_gpd.dissolve()
 
         self.logger.info("Extracting verts for dataframe")
-        # Get the vertices as a dataframe in the same CRS
-        verts_df = self.get_verts_geodataframe(ROI_gpd.crs)
+        # Get the vertices as a dataframe in the same CRS. Both the dataframe and the spatial
+        # index hanging off it are cached, keyed on the CRS object (which is hashable, unlike
+        # to_epsg() which can be None and collide), because chunked workflows call this method
+        # once per cluster of cameras and rebuilding them dominates. The mesh object is stored in
+        # the entry and compared by identity so an entry built from a mesh that has since been
+        # replaced (e.g. by cropping or downsampling in load_mesh) is never silently reused
+        cached_entry = self.verts_gdf_cache.get(ROI_gpd.crs)
+        if cached_entry is None or cached_entry[0] is not self.pyvista_mesh:
+            cached_entry = (
+                self.pyvista_mesh,
+                self.get_verts_geodataframe(ROI_gpd.crs),
+            )
+            self.verts_gdf_cache[ROI_gpd.crs] = cached_entry
+        verts_df = cached_entry[1]
         self.logger.info("Checking intersection of verts with ROI")
-        # Determine which vertices are within the ROI polygon
-        verts_in_ROI = gpd.tools.overlay(verts_df, ROI_gpd, how="intersection")
-        # Extract the IDs of the set within the polygon
-        vert_inds = verts_in_ROI["vert_ID"].to_numpy()
+        # Determine which vertices are within the ROI polygon by querying the R-tree spatial
+        # index with the single dissolved geometry. This replaces a full overlay, which
+        # materialized an intersection dataframe just to read the vertex IDs back out
+        vert_inds = np.sort(
+            verts_df.sindex.query(ROI_gpd.geometry.values[0], predicate="intersects")
+        )
 
         self.logger.info("Extracting points from pyvista mesh")
         # Extract a submesh using these IDs, which is returned as an UnstructuredGrid
@@ -601,6 +696,18 @@ class TexturedPhotogrammetryMesh:
     def get_IDs_to_labels(self):
         return self.IDs_to_labels
 
+    def get_num_classes(self) -> typing.Union[int, None]:
+        """Get the number of classes implied by the IDs_to_labels mapping
+
+        Returns:
+            typing.Union[int, None]: One more than the maximum class ID, or None if no mapping is set
+        """
+        if self.IDs_to_labels is None:
+            return None
+        # Use the builtin max over the dict keys, which avoids materializing a list or going
+        # through a numpy reduction for what is a tiny dict
+        return max(self.IDs_to_labels) + 1
+
     def get_label_names(self):
         self.logger.warning(
             "This method will be deprecated in favor of get_IDs_to_labels since it doesn't handle non-sequential indices"
@@ -618,15 +725,25 @@ class TexturedPhotogrammetryMesh:
             transform_4x4 (np.ndarray): Transform to be applied
             in_place (bool): Should the vertices be updated for all member objects
         """
-        homogenous_local_points = np.vstack(
-            (self.pyvista_mesh.points.T, np.ones(self.pyvista_mesh.points.shape[0]))
-        )
-        transformed_local_points = transform_4x4 @ homogenous_local_points
-        transformed_local_points = transformed_local_points[:3].T
+        points = self.verts
+        if np.array_equal(transform_4x4[3], (0, 0, 0, 1)):
+            # The transform is affine, so the result can be computed directly on the (n, 3)
+            # points as a rotation plus translation without stacking a homogeneous coordinate
+            # row or transposing the full array
+            transformed_local_points = (
+                points @ transform_4x4[:3, :3].T + transform_4x4[:3, 3]
+            )
+        else:
+            # General projective transform, which requires the full homogeneous treatment
+            homogenous_local_points = np.vstack((points.T, np.ones(points.shape[0])))
+            transformed_local_points = transform_4x4 @ homogenous_local_points
+            transformed_local_points = transformed_local_points[:3].T
 
         # Overwrite existing vertices in both pytorch3d and pyvista mesh
         if in_place:
             self.pyvista_mesh.points = transformed_local_points.copy()
+            # Refresh the cached numpy view so it tracks the new VTK-backed array
+            self.verts = np.asarray(self.pyvista_mesh.points)
         return transformed_local_points
 
     def get_vertices_in_CRS(
@@ -643,27 +760,37 @@ class TexturedPhotogrammetryMesh:
         """
         # If no CRS is requested, just return the points
         if output_CRS is None:
-            return self.pyvista_mesh.points
+            return self.verts
 
         # The mesh points are defined in an arbitrary local coordinate system but we can transform them to EPGS:4978,
         # the earth-centered, earth-fixed coordinate system, using an included transform
         epgs4978_verts = self.transform_vertices(self.local_to_epgs_4978_transform)
 
-        # TODO figure out why this conversion was required. I think it was some typing issue
-        output_CRS = pyproj.CRS.from_epsg(output_CRS.to_epsg())
-        # Build a pyproj transfrormer from EPGS:4978 to the desired CRS
-        transformer = pyproj.Transformer.from_crs(
-            EARTH_CENTERED_EARTH_FIXED_CRS, output_CRS
+        # Look up the pyproj transformer from EPGS:4978 to the desired CRS. Transformer
+        # construction is expensive, so a shared cache keyed on the EPSG codes reuses one
+        # transformer across the many calls made during rendering and export
+        transformer = get_cached_transformer(
+            EARTH_CENTERED_EARTH_FIXED_CRS.to_epsg(), output_CRS.to_epsg()
         )
 
-        # Transform the coordinates
-        verts_in_output_CRS = transformer.transform(
-            xx=epgs4978_verts[:, 0],
-            yy=epgs4978_verts[:, 1],
-            zz=epgs4978_verts[:, 2],
-        )
-        # Stack and transpose
-        verts_in_output_CRS = np.vstack(verts_in_output_CRS).T
+        # Transform the coordinates in fixed-size blocks written straight into the output array.
+        # Blocking keeps each xx/yy/zz working set cache-resident through the PROJ pipeline on
+        # very large meshes, and writing into preallocated columns avoids the full-size
+        # stack-and-transpose copy of the result
+        n_verts = epgs4978_verts.shape[0]
+        block_size = 1 << 18
+        verts_in_output_CRS = np.empty_like(epgs4978_verts)
+        for block_start in range(0, n_verts, block_size):
+            block = slice(block_start, min(block_start + block_size, n_verts))
+            (
+                verts_in_output_CRS[block, 0],
+                verts_in_output_CRS[block, 1],
+                verts_in_output_CRS[block, 2],
+            ) = transformer.transform(
+                xx=epgs4978_verts[block, 0],
+                yy=epgs4978_verts[block, 1],
+                zz=epgs4978_verts[block, 2],
+            )
 
         # Pyproj respects the CRS axis ordering, which is northing/easting for most projected coordinate systems
         # This causes headaches because it's assumed by rasterio and geopandas to be easting/northing
@@ -762,14 +889,9 @@ class TexturedPhotogrammetryMesh:
             if faces_mask is not None:
                 faces = faces[faces_mask]
 
-            # Extract the first two columns and convert them to a list of tuples of tuples
-            faces_2d_tuples = [tuple(map(tuple, a)) for a in faces[..., :2]]
-            face_polygons = [
-                Polygon(face_tuple)
-                for face_tuple in tqdm(
-                    faces_2d_tuples, desc=f"Converting faces to polygons"
-                )
-            ]
+            # Build all the polygons with one vectorized shapely call on the (n_faces, 3, 2)
+            # coordinate array, rather than constructing a Python-level Polygon per face
+            face_polygons = shapely.polygons(faces[..., :2])
             self.logger.info("Creating dataframe of faces")
 
             if cache_data:
@@ -812,20 +934,83 @@ class TexturedPhotogrammetryMesh:
 
     # Transform labels face<->vertex methods
 
+    def get_vertex_face_adjacency(self):
+        """Return the vertex-to-face incidence of the mesh in a CSR-like layout
+
+        The incidence is built once by sorting the (vertex, face) pairs by vertex and cached,
+        since it only depends on the mesh topology. Any method that needs to answer "which faces
+        touch this vertex" should consume this rather than scanning the face array.
+
+        Returns:
+            np.ndarray: (3 * n_faces,) The face index of each incidence pair, sorted by vertex
+            np.ndarray: (n_verts + 1,) Offsets into the face indices, so the faces touching
+                vertex v are the slice between elements v and v + 1
+        """
+        if self.vert_face_adjacency_cache is None:
+            vertex_inds = self.faces.ravel()
+            face_inds = np.repeat(np.arange(self.faces.shape[0]), self.faces.shape[1])
+            pair_order = np.argsort(vertex_inds, kind="stable")
+            sorted_vertex_inds = vertex_inds[pair_order]
+            # The slice bounds per vertex, in the style of a scipy CSR index pointer
+            indptr = np.searchsorted(
+                sorted_vertex_inds, np.arange(self.verts.shape[0] + 1)
+            )
+            self.vert_face_adjacency_cache = (
+                sorted_vertex_inds,
+                face_inds[pair_order],
+                indptr,
+            )
+        return self.vert_face_adjacency_cache[1], self.vert_face_adjacency_cache[2]
+
     def face_to_vert_texture(self, face_IDs):
-        """_summary_
+        """Convert per-face IDs to per-vertex IDs by voting across the incident faces
+
+        Each vertex takes the most common ID among the faces that use it, with ties broken
+        toward the lowest ID. Vertices used by no face, or only by faces with non-finite IDs,
+        are set to nan.
 
         Args:
             face_IDs (np.array): (n_faces,) The integer IDs of the faces
+
+        Returns:
+            np.ndarray: (n_verts,) The ID of each vertex
         """
-        raise NotImplementedError()
-        # TODO figure how to have a NaN class that
-        for i in tqdm(range(self.pyvista_mesh.points.shape[0])):
-            # Find which faces are using this vertex
-            matching = np.sum(self.faces == i, axis=1)
-            # matching_inds = np.where(matching)[0]
-            # matching_IDs = face_IDs[matching_inds]
-            # most_common_ind = Counter(matching_IDs).most_common(1)
+        face_IDs = np.squeeze(face_IDs)
+        n_verts = self.verts.shape[0]
+
+        # The vertex->face incidence only depends on the mesh topology, so it is built once and
+        # shared rather than rescanning the full face array once per vertex
+        sorted_face_inds, adjacency_indptr = self.get_vertex_face_adjacency()
+        # The vertex index of each incidence pair, reconstructed from the CSR offsets
+        sorted_vertex_inds = np.repeat(np.arange(n_verts), np.diff(adjacency_indptr))
+
+        max_ID = np.nanmax(face_IDs)
+        # This means that all textures are nans
+        if not np.isfinite(max_ID):
+            self.logger.warn(
+                "In face to vertex texture conversion, all nans encountered"
+            )
+            return np.full(n_verts, fill_value=np.nan)
+
+        n_classes = int(max_ID) + 1
+        # Gather the ID of each incident face and drop non-finite entries so they cast no votes
+        IDs_per_pair = face_IDs[sorted_face_inds]
+        finite_mask = np.isfinite(IDs_per_pair)
+        # Count the votes for every (vertex, class) combination with a single bincount over a
+        # flattened index
+        counts_per_class_per_vert = np.bincount(
+            sorted_vertex_inds[finite_mask] * n_classes
+            + IDs_per_pair[finite_mask].astype(int),
+            minlength=n_verts * n_classes,
+        ).reshape(n_verts, n_classes)
+        # Mask out the vertices that received no votes
+        zeros_mask = np.all(counts_per_class_per_vert == 0, axis=1)
+        most_common_class_per_vert = np.argmax(
+            counts_per_class_per_vert, axis=1
+        ).astype(float)
+        most_common_class_per_vert[zeros_mask] = np.nan
+
+        return most_common_class_per_vert
 
     def vert_to_face_texture(self, vert_IDs, discrete=True):
         if vert_IDs is None:
@@ -851,22 +1036,29 @@ class TexturedPhotogrammetryMesh:
                 return np.full(values_per_face.shape[0], fill_value=np.nan)
 
             max_ID = int(max_ID)
-            # TODO consider using unique if these indices are sparse
-            counts_per_class_per_face = np.array(
-                [np.sum(values_per_face == i, axis=1) for i in range(max_ID + 1)]
-            ).T
+            n_classes = max_ID + 1
+            n_faces = values_per_face.shape[0]
+            # Build the per-face, per-class vote counts with a single bincount over a flattened
+            # (face, class) index, rather than scanning the full array once per class in Python.
+            # Non-finite vertex IDs are dropped so they simply contribute no votes
+            finite_mask = np.isfinite(values_per_face).ravel()
+            flat_IDs = values_per_face.ravel()[finite_mask].astype(int)
+            flat_rows = np.repeat(np.arange(n_faces), values_per_face.shape[1])[
+                finite_mask
+            ]
+            counts_per_class_per_face = np.bincount(
+                flat_rows * n_classes + flat_IDs, minlength=n_faces * n_classes
+            ).reshape(n_faces, n_classes)
             # Check which entires had no classes reported and mask them out
             # TODO consider removing these rows beforehand
             zeros_mask = np.all(counts_per_class_per_face == 0, axis=1)
-            # We want to fairly tiebreak since np.argmax will always take th first index
-            # This is hard to do in a vectorized way, so we just add a small random value
-            # independently to each element
-            counts_per_class_per_face = (
-                counts_per_class_per_face
-                + np.random.random(counts_per_class_per_face.shape) * 0.5
-            )
+            # We want to fairly tiebreak since np.argmax will always take the first index. A
+            # single per-class jitter smaller than the counting resolution randomizes the
+            # preference order between tied classes without a full-size random array
+            rng = np.random.default_rng()
+            class_jitter = rng.random(n_classes) * 0.4
             most_common_class_per_face = np.argmax(
-                counts_per_class_per_face, axis=1
+                counts_per_class_per_face + class_jitter, axis=1
             ).astype(float)
             # Set any faces with zero counts to nan
             most_common_class_per_face[zeros_mask] = np.nan
@@ -1253,6 +1445,16 @@ class TexturedPhotogrammetryMesh:
         if drop_nan:
             # Drop nan from the list of IDs
             unique_IDs = unique_IDs[np.isfinite(unique_IDs)]
+
+        # Pull the geometry out as a raw array once so the per-class indexing below is a numpy
+        # gather rather than pandas row selection
+        face_geometry = faces_gdf.geometry.values
+        if not face_labels_is_2d:
+            # Group the face indices by label with one sort, so each class below is a contiguous
+            # slice instead of a comparison scan over all the labels per class
+            label_order = np.argsort(face_labels, kind="stable")
+            sorted_labels = face_labels[label_order]
+
         multipolygon_list = []
         # For each unique ID, aggregate all the faces together
         # This is the same as geopandas.groupby, but that is slow and can out of memory easily
@@ -1261,13 +1463,13 @@ class TexturedPhotogrammetryMesh:
         for unique_ID in tqdm(unique_IDs, desc="Merging faces for each class"):
             if face_labels_is_2d:
                 # Nonzero elements of the column
-                matching_face_mask = face_labels[:, unique_ID] > 0
+                matching_face_inds = np.nonzero(face_labels[:, unique_ID] > 0)[0]
             else:
-                # Elements that match the ID in question
-                matching_face_mask = face_labels == unique_ID
-            matching_face_inds = np.nonzero(matching_face_mask)[0]
-            matching_face_polygons = faces_gdf.iloc[matching_face_inds]
-            list_of_polygons = matching_face_polygons.geometry.values
+                # The slice of the sorted order containing the ID in question
+                start_ind = np.searchsorted(sorted_labels, unique_ID, side="left")
+                stop_ind = np.searchsorted(sorted_labels, unique_ID, side="right")
+                matching_face_inds = label_order[start_ind:stop_ind]
+            list_of_polygons = face_geometry[matching_face_inds]
             multipolygon = batched_unary_union(
                 list_of_polygons, **batched_unary_union_kwargs
             )
@@ -1429,7 +1631,7 @@ class TexturedPhotogrammetryMesh:
             use_vertex_labels = True
         elif labels is not None:
             # Check the size of the input labels and set what type they are. Note this could override existing value
-            if labels.shape[0] == self.pyvista_mesh.points.shape[0]:
+            if labels.shape[0] == self.verts.shape[0]:
                 use_vertex_labels = True
             elif labels.shape[0] == self.faces.shape[0]:
                 use_vertex_labels = False
@@ -1511,7 +1713,7 @@ class TexturedPhotogrammetryMesh:
             int: A hash value representing the current mesh.
         """
         hasher = hashlib.sha256()
-        hasher.update(self.pyvista_mesh.points.tobytes())
+        hasher.update(self.verts.tobytes())
         hasher.update(self.pyvista_mesh.faces.tobytes())
         return hasher.hexdigest()
 
@@ -1731,6 +1933,7 @@ class TexturedPhotogrammetryMesh:
         batch_size: int = 1,
         aggregate_img_scale: float = 1,
         check_null_image: bool = False,
+        prefetch_images: bool = False,
         **pix2face_kwargs,
     ):
         """Find the per-face projection for each of a set of images and associated camera
@@ -1747,39 +1950,85 @@ class TexturedPhotogrammetryMesh:
             check_null_image (bool, optional):
                 Only do indexing if there are non-null image values. This adds additional overhead,
                 but can save the expensive operation of indexing in cases where it would be a no-op.
+            prefetch_images (bool, optional):
+                Load the images for each batch on background threads while the pix2face
+                correspondences are being computed, hiding the disk read and decode latency
+                behind the rendering work. Defaults to False.
 
         Yields:
             np.ndarray: The per-face projection of an image in the camera set
         """
         n_faces = self.faces.shape[0]
 
-        # Iterate over batch of the cameras
-        batch_stop = max(len(cameras) - batch_size + 1, 1)
-        for batch_start in range(0, batch_stop, batch_size):
-            batch_inds = list(range(batch_start, batch_start + batch_size))
-            batch_cameras = cameras.get_subset_cameras(batch_inds)
-            # Compute a batch of pix2face correspondences. This is likely the slowest step
-            batch_pix2face = self.pix2face(
-                cameras=batch_cameras,
-                render_img_scale=aggregate_img_scale,
-                **pix2face_kwargs,
-            )
-            for i, pix2face in enumerate(batch_pix2face):
-                img = cameras.get_image_by_index(batch_start + i, aggregate_img_scale)
-
-                n_channels = 1 if img.ndim == 2 else img.shape[-1]
-                textured_faces = np.full((n_faces, n_channels), fill_value=np.nan)
-
-                # Only do the expensive indexing step if there are finite values in the image. This is most
-                # significant for sparse detection tasks where some images may have no real data
-                if not check_null_image or np.any(np.isfinite(img)):
-                    flat_img = np.reshape(img, (img.shape[0] * img.shape[1], -1))
-                    flat_pix2face = pix2face.flatten()
-                    # TODO this creates ill-defined behavior if multiple pixels map to the same face
-                    # my guess is the later pixel in the flattened array will override the former
-                    # TODO make sure that null pix2face values are handled properly
-                    textured_faces[flat_pix2face] = flat_img
-                yield textured_faces
+        # Image decoding mostly releases the GIL, so threads are enough to overlap it with the
+        # rendering computation
+        image_loading_executor = (
+            ThreadPoolExecutor(max_workers=2) if prefetch_images else None
+        )
+
+        # The body runs under try/finally so the executor is shut down even if the consumer
+        # abandons the generator early or an exception escapes the loop
+        try:
+            # Iterate over batch of the cameras
+            batch_stop = max(len(cameras) - batch_size + 1, 1)
+            for batch_start in range(0, batch_stop, batch_size):
+                batch_inds = list(range(batch_start, batch_start + batch_size))
+                batch_cameras = cameras.get_subset_cameras(batch_inds)
+                # Kick off the image loads for this batch before the expensive correspondence
+                # computation so they arrive while the rendering runs
+                if image_loading_executor is not None:
+                    image_futures = [
+                        image_loading_executor.submit(
+                            cameras.get_image_by_index, ind, aggregate_img_scale
+                        )
+                        for ind in batch_inds
+                    ]
+                # Compute a batch of pix2face correspondences. This is likely the slowest step
+                batch_pix2face = self.pix2face(
+                    cameras=batch_cameras,
+                    render_img_scale=aggregate_img_scale,
+                    **pix2face_kwargs,
+                )
+                for i, pix2face in enumerate(batch_pix2face):
+                    if image_loading_executor is not None:
+                        img = image_futures[i].result()
+                    else:
+                        img = cameras.get_image_by_index(
+                            batch_start + i, aggregate_img_scale
+                        )
+
+                    n_channels = 1 if img.ndim == 2 else img.shape[-1]
+                    textured_faces = np.full((n_faces, n_channels), fill_value=np.nan)
+
+                    # Only do the expensive indexing step if there are finite values in the image. This is most
+                    # significant for sparse detection tasks where some images may have no real data
+                    if not check_null_image or np.any(np.isfinite(img)):
+                        flat_img = np.reshape(img, (img.shape[0] * img.shape[1], -1))
+                        flat_pix2face = pix2face.flatten()
+                        # Only aggregate pixels that actually hit the mesh and carry finite values.
+                        # Without the first mask, the -1 background entries would silently write into
+                        # the last face; the second keeps null pixels from poisoning the average
+                        valid_pixels = np.logical_and(
+                            flat_pix2face != -1, np.all(np.isfinite(flat_img), axis=1)
+                        )
+                        valid_faces = flat_pix2face[valid_pixels]
+                        # When multiple pixels map to the same face, average them rather than letting
+                        # the last pixel in the flattened array win. np.add.at handles the duplicate
+                        # indices that plain fancy-indexed assignment would drop
+                        summed_values = np.zeros(
+                            (n_faces, n_channels), dtype=np.float32
+                        )
+                        np.add.at(summed_values, valid_faces, flat_img[valid_pixels])
+                        pixel_counts = np.bincount(valid_faces, minlength=n_faces)
+                        projected_faces = pixel_counts > 0
+                        textured_faces[projected_faces] = (
+                            summed_values[projected_faces]
+                            / pixel_counts[projected_faces, None]
+                        )
+                    yield textured_faces
+        finally:
+            if image_loading_executor is not None:
+                image_loading_executor.shutdown()
 
     def aggregate_projected_images(
         self,
@@ -1823,7 +2072,9 @@ class TexturedPhotogrammetryMesh:
         # TODO this should be a convenience method
         n_faces = self.faces.shape[0]
 
-        projection_counts = np.zeros(n_faces)
+        # The counts are small non-negative integers, so use a compact integer dtype rather than
+        # the default float64 to reduce the memory traffic of the repeated accumulation
+        projection_counts = np.zeros(n_faces, dtype=np.uint32)
         summed_projection = None
 
         for projection_for_image in tqdm(
@@ -1834,16 +2085,19 @@ class TexturedPhotogrammetryMesh:
             if return_all:
                 all_projections.append(projection_for_image)
 
+            # float32 is plenty of precision for accumulating pixel values and halves the
+            # bandwidth of the repeated reduction. The per-image projection must be cast too,
+            # since stacking it as float64 would silently promote the whole reduction back up
+            projection_for_image_f32 = projection_for_image.astype(np.float32)
             if summed_projection is None:
-                summed_projection = projection_for_image.astype(float)
+                summed_projection = projection_for_image_f32
             else:
                 summed_projection = np.nansum(
-                    [summed_projection, projection_for_image], axis=0
+                    [summed_projection, projection_for_image_f32], axis=0
                 )
 
-            projected_faces = np.any(np.isfinite(projection_for_image), axis=1).astype(
-                int
-            )
+            # The boolean mask can be accumulated directly without an intermediate integer copy
+            projected_faces = np.any(np.isfinite(projection_for_image), axis=1)
             projection_counts += projected_faces
 
         no_projections = projection_counts == 0
@@ -1857,9 +2111,16 @@ class TexturedPhotogrammetryMesh:
         if return_all:
             additional_information["all_projections"] = all_projections
 
-        average_projections = np.divide(
-            summed_projection, np.expand_dims(projection_counts, 1)
+        # Normalize with a reciprocal multiply in float32, computed only for observed faces.
+        # Unobserved rows are already nan from the masking above and stay nan since nan * 0 = nan,
+        # so the division machinery never runs on them
+        reciprocal_counts = np.zeros(projection_counts.shape, dtype=np.float32)
+        observed_faces = np.logical_not(no_projections)
+        reciprocal_counts[observed_faces] = np.reciprocal(
+            projection_counts[observed_faces].astype(np.float32)
         )
+        average_projections = summed_projection.astype(np.float32)
+        average_projections *= np.expand_dims(reciprocal_counts, 1)
 
         return average_projections, additional_information
 
@@ -2057,70 +2318,98 @@ class TexturedPhotogrammetryMesh:
             camera_set, render_img_scale=render_image_scale, **render_kwargs
         )
 
-        # The computation only happens when items are requested from the generator
-        for i, rendered in enumerate(
-            tqdm(
-                render_gen,
-                total=len(camera_set),
-                desc="Computing and saving renders",
-            )
-        ):
-            ## All this is post-processing to visualize the rendered label.
-            # rendered could either be a one channel image of integer IDs,
-            # a one-channel image of scalars, or a three-channel image of
-            # RGB. It could also be multi-channel image corresponding to anything,
-            # but we don't expect that yet
-
-            if save_native_resolution and render_image_scale != 1:
-                native_size = camera_set[i].get_image_size()
-                # Upsample using nearest neighbor interpolation for discrete labels and
-                # bilinear for non-discrete
-                # TODO this will need to be fixed for multi-channel images since I don't think resize works
-                rendered = resize(
-                    rendered,
-                    native_size,
-                    order=(0 if self.is_discrete_texture() else 1),
+        # Encode and write the files on background threads so the next render can be computed
+        # while the previous one is compressed and written to disk. PNG encoding and file I/O
+        # release the GIL, so this overlaps cleanly with the rendering work
+        image_writing_executor = ThreadPoolExecutor(max_workers=4)
+        write_futures = []
+
+        # The drain and shutdown run under try/finally so a failure mid-loop still surfaces any
+        # pending write error and doesn't leak the pool
+        try:
+            # The computation only happens when items are requested from the generator
+            for i, rendered in enumerate(
+                tqdm(
+                    render_gen,
+                    total=len(camera_set),
+                    desc="Computing and saving renders",
                 )
+            ):
+                ## All this is post-processing to visualize the rendered label.
+                # rendered could either be a one channel image of integer IDs,
+                # a one-channel image of scalars, or a three-channel image of
+                # RGB. It could also be multi-channel image corresponding to anything,
+                # but we don't expect that yet
+
+                if save_native_resolution and render_image_scale != 1:
+                    native_size = camera_set[i].get_image_size()
+                    # Upsample using nearest neighbor interpolation for discrete labels and
+                    # bilinear for non-discrete
+                    # TODO this will need to be fixed for multi-channel images since I don't think resize works
+                    rendered = resize(
+                        rendered,
+                        native_size,
+                        order=(0 if self.is_discrete_texture() else 1),
+                    )
 
-            if make_composites:
-                RGB_image = camera_set[i].get_image(
-                    image_scale=(1.0 if save_native_resolution else render_image_scale)
-                )
-                rendered = create_composite(
-                    RGB_image=RGB_image,
-                    label_image=rendered,
-                    IDs_to_labels=self.get_IDs_to_labels(),
-                )
-            else:
-                # Clip channels if needed
-                if rendered.ndim == 3:
-                    rendered = rendered[..., :3]
-
-            if cast_to_uint8:
-                # Deterimine values that cannot be represented as uint8
-                mask = np.logical_or.reduce(
-                    [
-                        rendered < 0,
-                        rendered > 255,
-                        np.logical_not(np.isfinite(rendered)),
-                    ]
-                )
-                rendered[mask] = uint8_value_for_null_texture
-                # Cast and squeeze since you can't save a one-channel image
-                rendered = np.squeeze(rendered.astype(np.uint8))
+                if make_composites:
+                    RGB_image = camera_set[i].get_image(
+                        image_scale=(
+                            1.0 if save_native_resolution else render_image_scale
+                        )
+                    )
+                    rendered = create_composite(
+                        RGB_image=RGB_image,
+                        label_image=rendered,
+                        IDs_to_labels=self.get_IDs_to_labels(),
+                    )
+                else:
+                    # Clip channels if needed
+                    if rendered.ndim == 3:
+                        rendered = rendered[..., :3]
+
+                if cast_to_uint8:
+                    # Deterimine values that cannot be represented as uint8
+                    mask = np.logical_or.reduce(
+                        [
+                            rendered < 0,
+                            rendered > 255,
+                            np.logical_not(np.isfinite(rendered)),
+                        ]
+                    )
+                    rendered[mask] = uint8_value_for_null_texture
+                    # Cast and squeeze since you can't save a one-channel image
+                    rendered = np.squeeze(rendered.astype(np.uint8))
 
-            # Saving
-            output_filename = Path(
-                output_folder, camera_set.get_image_filename(i, absolute=False)
-            )
-            # This may create nested folders in the output dir
-            ensure_containing_folder(output_filename)
-            if rendered.dtype == np.uint8:
-                output_filename = str(output_filename.with_suffix(".png"))
+                # Saving
+                output_filename = Path(
+                    output_folder, camera_set.get_image_filename(i, absolute=False)
+                )
+                # This may create nested folders in the output dir
+                ensure_containing_folder(output_filename)
+                if rendered.dtype == np.uint8:
+                    output_filename = str(output_filename.with_suffix(".png"))
+
+                    # Save the image
+                    write_futures.append(
+                        image_writing_executor.submit(
+                            skimage.io.imsave,
+                            output_filename,
+                            rendered,
+                            check_contrast=False,
+                        )
+                    )
+                else:
+                    output_filename = str(output_filename.with_suffix(".npy"))
+                    # Save the image
+                    write_futures.append(
+                        image_writing_executor.submit(
+                            np.save, output_filename, rendered
+                        )
+                    )
 
-                # Save the image
-                skimage.io.imsave(output_filename, rendered, check_contrast=False)
-            else:
-                output_filename = str(output_filename.with_suffix(".npy"))
-                # Save the image
-                np.save(output_filename, rendered)
+        finally:
+            # Wait for the outstanding writes and surface any exception they raised
+            for write_future in write_futures:
+                write_future.result()
+            image_writing_executor.shutdown()
@@ -1,5 +1,6 @@
 import os
 import typing
+from collections import OrderedDict
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -7,11 +8,11 @@ import numpy as np
 import pandas as pd
 from imageio import imread
 from PIL import Image
-from skimage.transform import resize
 
 from geograypher.constants import PATH_TYPE
 from geograypher.predictors import Segmentor
 from geograypher.utils.files import ensure_containing_folder
+from geograypher.utils.image import nearest_resize
 
 
 class BrightnessSegmentor(Segmentor):
@@ -28,24 +29,67 @@ class BrightnessSegmentor(Segmentor):
 
 
 class LookUpSegmentor(Segmentor):
-    def __init__(self, base_folder, lookup_folder, num_classes=10):
+    def __init__(self, base_folder, lookup_folder, num_classes=10, cache_size: int = 8):
+        """Look up pre-computed segmentation label images from a parallel folder structure
+
+        Args:
+            base_folder (PATH_TYPE): Folder of images that the queried filenames are relative to
+            lookup_folder (PATH_TYPE): Folder of label images in the same structure as base_folder
+            num_classes (int, optional): The number of classes in the labels. Defaults to 10.
+            cache_size (int, optional):
+                Retain up to this many decoded label images in memory, keyed by path. This avoids
+                repeated decodes when chunked aggregation revisits cameras from overlapping
+                clusters. Set to 0 to disable. Defaults to 8.
+        """
         self.base_folder = Path(base_folder)
         self.lookup_folder = lookup_folder
         self.num_classes = num_classes
+        self.cache_size = cache_size
+        # Most-recently-used entries are kept at the end
+        self.decoded_label_cache = OrderedDict()
+        # num_classes is fixed for the lifetime of the segmentor, so the comparison array for the
+        # one-hot encoding can be built once here instead of on every segment_image call
+        self.class_values = np.arange(num_classes)
+
+    def read_label_image(self, lookup_path: PATH_TYPE) -> np.ndarray:
+        """Read a label image, using the bounded in-memory cache if enabled
+
+        Args:
+            lookup_path (PATH_TYPE): Path of the label image to read
+
+        Returns:
+            np.ndarray: The decoded label image
+        """
+        if self.cache_size <= 0:
+            return imread(lookup_path)
+
+        key = str(lookup_path)
+        if key in self.decoded_label_cache:
+            # Mark this entry as most-recently used
+            self.decoded_label_cache.move_to_end(key)
+            return self.decoded_label_cache[key]
+
+        image = imread(lookup_path)
+        self.decoded_label_cache[key] = image
+        # Evict the least-recently-used entry if over the size limit
+        if len(self.decoded_label_cache) > self.cache_size:
+            self.decoded_label_cache.popitem(last=False)
+        return image
 
     def segment_image(self, image: np.ndarray, filename: PATH_TYPE, image_scale: float):
         relative_path = Path(filename).relative_to(self.base_folder)
         lookup_path = Path(self.lookup_folder, relative_path)
         lookup_path = lookup_path.with_suffix(".png")
 
-        image = imread(lookup_path)
+        image = self.read_label_image(lookup_path)
         if image_scale != 1:
-            image = resize(
+            # Nearest neighbor interpolation, preserving the integer label values
+            image = nearest_resize(
                 image,
                 (int(image.shape[0] * image_scale), int(image.shape[1] * image_scale)),
-                order=0,  # Nearest neighbor interpolation
             )
-        one_hot_image = self.inds_to_one_hot(image, num_classes=self.num_classes)
+        # Specialized version of Segmentor.inds_to_one_hot using the precomputed class values
+        one_hot_image = image[..., np.newaxis] == self.class_values
         return one_hot_image
 
 
@@ -268,8 +312,9 @@ class TabularRectangleSegmentor(Segmentor):
             plt.show()
 
         if image_scale != 1.0:
-            output_size = (int(image_scale * x) for x in label_image.shape[:2])
-            label_image = resize(label_image, output_size, order=0)
+            output_size = tuple(int(image_scale * x) for x in label_image.shape[:2])
+            # Nearest neighbor interpolation
+            label_image = nearest_resize(label_image, output_size)
 
         return label_image
 
@@ -56,14 +56,10 @@ class Segmentor:
             inds_image_copy[inds_image_copy == ignore_ind] == 0
             num_classes = np.max(inds_image_copy) + 1
 
-        one_hot_array = np.zeros(
-            (inds_image.shape[0], inds_image.shape[1], num_classes), dtype=bool
-        )
-        # Iterate up to max ind, not num_classes to avoid wasted computation when there won't be matches
-        for i in range(num_classes):
-            # TODO determine if there are any more efficient ways to do this
-            # Maybe create all these slices and then concatenate
-            # Or test equality with an array that has all the values in it
-            one_hot_array[..., i] = inds_image == i
+        # Compare against an array containing all the class values at once. Broadcasting produces
+        # the full (m, n, num_classes) boolean array in a single compiled pass rather than one
+        # per-class scan of the image
+        class_values = np.arange(num_classes)
+        one_hot_array = inds_image[..., np.newaxis] == class_values
 
         return one_hot_array
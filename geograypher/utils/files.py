@@ -1,8 +1,33 @@
+import os
 from pathlib import Path
 
+import numpy as np
+
 from geograypher.constants import PATH_TYPE
 
 
+def save_numpy_atomic(savefile: PATH_TYPE, array: np.ndarray):
+    """Save a numpy array to disk so the file appears atomically
+
+    The array is written to a temporary file alongside the destination and then renamed into
+    place. The rename is atomic on POSIX filesystems, so readers never observe a partially
+    written file, even if the process crashes mid-save.
+
+    Args:
+        savefile (PATH_TYPE): Where to save the array. The containing folder will be created
+        array (np.ndarray): The array to save
+    """
+    savefile = Path(savefile)
+    ensure_containing_folder(savefile)
+    temp_savefile = savefile.with_suffix(savefile.suffix + ".tmp")
+    # np.save appends .npy if the suffix is missing, so open the file ourselves to keep the
+    # temporary name predictable
+    with open(temp_savefile, "wb") as file_handle:
+        np.save(file_handle, array)
+    # Atomically publish the finished file
+    os.replace(temp_savefile, savefile)
+
+
 def ensure_folder(folder: PATH_TYPE):
     """Ensure this folder, and parent folders, exist. Nothing happens if already present
 
@@ -1,3 +1,4 @@
+import functools
 import logging
 import typing
 
@@ -57,8 +58,35 @@ def get_projected_CRS(lat, lon, assume_western_hem=True):
     return crs
 
 
+@functools.lru_cache(maxsize=32)
+def get_cached_transformer(input_epsg: int, output_epsg: int) -> pyproj.Transformer:
+    """Return a pyproj transformer between two EPSG codes, cached across calls
+
+    Constructing a transformer is expensive since pyproj has to resolve the PROJ pipeline, so
+    repeated transforms between the same pair of systems should reuse one object. The default
+    authority axis order is preserved to match direct Transformer.from_crs usage.
+
+    Args:
+        input_epsg (int): EPSG code of the source CRS
+        output_epsg (int): EPSG code of the destination CRS
+
+    Returns:
+        pyproj.Transformer: Transformer from the source to the destination CRS
+    """
+    return pyproj.Transformer.from_crs(
+        pyproj.CRS.from_epsg(input_epsg), pyproj.CRS.from_epsg(output_epsg)
+    )
+
+
 def convert_CRS_3D_points(points, input_CRS, output_CRS):
-    transformer = pyproj.Transformer.from_crs(input_CRS, output_CRS)
+    # Use the cached transformer when both systems have EPSG codes, since building a transformer
+    # is far more expensive than applying it for typical point counts
+    input_epsg = pyproj.CRS(input_CRS).to_epsg()
+    output_epsg = pyproj.CRS(output_CRS).to_epsg()
+    if input_epsg is not None and output_epsg is not None:
+        transformer = get_cached_transformer(input_epsg, output_epsg)
+    else:
+        transformer = pyproj.Transformer.from_crs(input_CRS, output_CRS)
 
     # Transform the coordinates
     points_in_output_CRS = transformer.transform(
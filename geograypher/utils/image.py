@@ -1,7 +1,42 @@
+import numpy as np
 import piexif
 from PIL import Image
 
 
+def nearest_resize(image: np.ndarray, output_shape: tuple) -> np.ndarray:
+    """Nearest-neighbor resize implemented with integer index sampling
+
+    Unlike general-purpose resize routines, this never converts the data to float, so integer
+    label images keep their exact values and no interpolation buffers are allocated.
+
+    Args:
+        image (np.ndarray): (h, w) or (h, w, c) image to resize
+        output_shape (tuple): The (height, width) of the output
+
+    Returns:
+        np.ndarray: The resized image, with the same dtype as the input
+    """
+    # Map each output pixel center back to the nearest input pixel center
+    rows = np.clip(
+        np.round(
+            (np.arange(output_shape[0]) + 0.5) * (image.shape[0] / output_shape[0])
+            - 0.5
+        ),
+        0,
+        image.shape[0] - 1,
+    ).astype(int)
+    cols = np.clip(
+        np.round(
+            (np.arange(output_shape[1]) + 0.5) * (image.shape[1] / output_shape[1])
+            - 0.5
+        ),
+        0,
+        image.shape[1] - 1,
+    ).astype(int)
+    # Sample with broadcasting, which gathers the output in a single pass
+    return image[rows[:, np.newaxis], cols]
+
+
 def get_GPS_exif(filename):
     im = Image.open(filename)
     exif_dict = piexif.load(im.info["exif"])
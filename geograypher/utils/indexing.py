@@ -17,15 +17,20 @@ def find_argmax_nonzero_value(
     Returns:
         np.array: The argmax, with nans for invalid or all-zero entries
     """
-    # Find the column with the highest value per row
-    argmax = np.argmax(array, axis=axis, keepdims=keepdims).astype(float)
-
-    # Find rows with zero sum or any infinite values
-    zero_sum_mask = np.sum(array, axis=axis) == 0
-    infinite_mask = np.any(~np.isfinite(array), axis=axis)
-
-    # Set these rows in the argmax to nan
-    argmax[np.logical_or(zero_sum_mask, infinite_mask)] = np.nan
+    # Find the column with the highest value per row. The argmax is kept as an integer array for
+    # now since upcasting to float here would force an extra full-size copy
+    argmax = np.argmax(array, axis=axis, keepdims=keepdims)
+
+    # Find rows with zero sum or any infinite values. The masks are combined with in-place ops so
+    # only one boolean temporary is allocated
+    invalid_mask = np.sum(array, axis=axis) == 0
+    invalid_mask |= np.any(~np.isfinite(array), axis=axis)
+    if keepdims:
+        invalid_mask = np.expand_dims(invalid_mask, axis=axis)
+
+    # Cast to float only at the end and set the invalid rows to nan in a single write
+    argmax = argmax.astype(float)
+    argmax[invalid_mask] = np.nan
 
     return argmax
 
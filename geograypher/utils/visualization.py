@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import typing
@@ -108,6 +109,31 @@ def get_vis_options_from_IDs_to_labels(
     return {"cmap": cmap, "vmin": vmin, "vmax": vmax, "discrete": discrete}
 
 
+@functools.lru_cache(maxsize=None)
+def get_colormap_LUT(cmap_name: str, discrete: bool) -> np.ndarray:
+    """Build a 256-entry lookup table of RGB values for a matplotlib colormap
+
+    Applying the table with a single fancy-indexed gather replaces matplotlib's per-pixel
+    colormap callable, which walks the image in Python-level machinery on every call. The table
+    is cached per colormap so it is only built once.
+
+    Args:
+        cmap_name (str): Name of the matplotlib colormap
+        discrete (bool):
+            If True, entries correspond to direct integer class indices into the colormap. If
+            False, they sample the colormap uniformly over [0, 1].
+
+    Returns:
+        np.ndarray: (256, 3) float32 RGB values in [0, 1]
+    """
+    cmap = plt.get_cmap(cmap_name)
+    if discrete:
+        LUT = cmap(np.arange(256))[:, :3]
+    else:
+        LUT = cmap(np.linspace(0, 1, 256))[:, :3]
+    return LUT.astype(np.float32)
+
+
 def create_composite(
     RGB_image: np.ndarray,
     label_image: np.ndarray,
@@ -149,7 +175,6 @@ def create_composite(
         label_image = np.squeeze(label_image)
 
         vis_options = get_vis_options_from_IDs_to_labels(IDs_to_labels)
-        cmap = plt.get_cmap(vis_options["cmap"])
         null_mask = np.logical_or(
             label_image == NULL_TEXTURE_INT_VALUE,
             np.logical_not(np.isfinite(label_image)),
@@ -164,42 +189,67 @@ def create_composite(
                 max_value = np.max(valid_pixels)
                 # Scale
                 label_image = label_image / max_value
+            # Quantize to the 256 colormap entries. Null pixels may be nan, so zero them first;
+            # they are overwritten through null_mask below anyway
+            label_image = np.clip(np.nan_to_num(label_image) * 255, 0, 255).astype(
+                np.uint8
+            )
         else:
             # Convert it to an int so it's used to directly index the colormap
             label_image = label_image.astype(np.uint8)
 
-        # Perform the colormapping
-        label_image = cmap(label_image)[..., :3]
+        # Perform the colormapping as a single gather through the cached lookup table
+        LUT = get_colormap_LUT(vis_options["cmap"], vis_options["discrete"])
+        label_image = LUT[label_image]
         # Mask invalid values
         label_image[null_mask] = 0
 
-    # Create a blended image
+    # Create a blended image. The (h, w, 1) grayscale mean broadcasts against the label panel in
+    # the blend below, so there is no need to materialize a tiled three-channel copy
     if grayscale_RGB_overlay:
-        RGB_for_composite = np.tile(
-            np.mean(RGB_image, axis=2, keepdims=True), (1, 1, 3)
-        )
+        RGB_for_composite = np.mean(RGB_image, axis=2, keepdims=True)
     else:
         RGB_for_composite = RGB_image
-    overlay = ((1 - label_blending_weight) * RGB_for_composite) + (
-        label_blending_weight * label_image
+
+    # Write each panel directly into the preallocated uint8 composite, fusing the scale-by-255
+    # and the cast into one strided pass per panel. This avoids concatenating a full-size float
+    # image and then copying it again during the cast, which dominates for large images
+    img_height, img_width = RGB_image.shape[:2]
+    composite = np.empty((img_height, 3 * img_width, 3), dtype=np.uint8)
+    np.multiply(label_image, 255, out=composite[:, :img_width], casting="unsafe")
+    np.multiply(
+        RGB_image, 255, out=composite[:, img_width : 2 * img_width], casting="unsafe"
     )
-    # Concatenate the images horizonally
-    composite = np.concatenate((label_image, RGB_image, overlay), axis=1)
-    # Cast to np.uint8 for saving
-    composite = (composite * 255).astype(np.uint8)
+    # Accumulate the blend in place so only one float temporary the size of a single panel
+    # exists. The label side goes first since the (h, w, 1) grayscale image can broadcast into
+    # the three-channel accumulator but not the other way around
+    overlay = label_blending_weight * label_image
+    overlay += (1 - label_blending_weight) * RGB_for_composite
+    np.multiply(overlay, 255, out=composite[:, 2 * img_width :], casting="unsafe")
     return composite
 
 
 def read_img_npy(filename):
+    """Read a file that is either an image or a saved numpy array
+
+    Args:
+        filename: The file to read
+
+    Raises:
+        ValueError: If the file cannot be read by either loader
+
+    Returns:
+        np.ndarray: The loaded data
+    """
     try:
         return imread(filename)
-    except:
+    except Exception:
         pass
 
     try:
         return np.load(filename)
-    except:
-        pass
+    except Exception:
+        raise ValueError(f"Could not read {filename} as an image or numpy array")
 
 
 def show_segmentation_labels(
@@ -211,8 +261,20 @@ def show_segmentation_labels(
     image_suffix=".JPG",
     IDs_to_labels=None,
 ):
-    rendered_files = list(Path(label_folder).rglob("*" + label_suffix))
-    np.random.shuffle(rendered_files)
+    # Reservoir-sample num_show files while streaming the rglob iterator, so the full recursive
+    # listing is never materialized or shuffled just to take a handful of random entries
+    rendered_files = []
+    for file_ind, rendered_file in enumerate(
+        Path(label_folder).rglob("*" + label_suffix)
+    ):
+        if len(rendered_files) < num_show:
+            rendered_files.append(rendered_file)
+        else:
+            # Each file replaces a reservoir entry with probability num_show / (file_ind + 1),
+            # which leaves a uniform random sample
+            replace_ind = np.random.randint(0, file_ind + 1)
+            if replace_ind < num_show:
+                rendered_files[replace_ind] = rendered_file
 
     if savefolder is not None:
         ensure_folder(savefolder)
@@ -226,14 +288,19 @@ def show_segmentation_labels(
             IDs_to_labels = {int(k): v for k, v in IDs_to_labels.items()}
 
     for i, rendered_file in tqdm(
-        enumerate(rendered_files[:num_show]), desc="Showing segmentation labels"
+        enumerate(rendered_files), desc="Showing segmentation labels"
     ):
         image_file = Path(
             image_folder, rendered_file.relative_to(label_folder)
         ).with_suffix(image_suffix)
 
         image = imread(image_file)
-        render = read_img_npy(rendered_file)
+        try:
+            render = read_img_npy(rendered_file)
+        except ValueError:
+            # Log and move on rather than failing the whole visualization run
+            logging.warning(f"Skipping unreadable label file {rendered_file}")
+            continue
         composite = create_composite(image, render, IDs_to_labels=IDs_to_labels)
 
         if savefolder is None:
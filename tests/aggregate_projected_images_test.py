@@ -0,0 +1,46 @@
+# %%
+import numpy as np
+import pyvista as pv
+
+from geograypher.meshes import TexturedPhotogrammetryMesh
+
+# Build a tiny mesh with three triangular faces
+points = np.array(
+    [
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [1.0, 1.0, 0.0],
+        [2.0, 1.0, 0.0],
+    ]
+)
+faces = np.array([3, 0, 1, 2, 3, 1, 3, 2, 3, 1, 4, 3])
+mesh = TexturedPhotogrammetryMesh(pv.PolyData(points, faces))
+
+# Per-image projections with known per-face values. The first face is seen by both images, the
+# second by neither, and the third by only one
+projections_per_image = [
+    np.array([[1.0], [np.nan], [3.0]]),
+    np.array([[3.0], [np.nan], [np.nan]]),
+]
+# Replace the projection step so the aggregation math can be checked numerically without
+# rendering. The cameras argument is only used for its length
+mesh.project_images = lambda cameras, **kwargs: iter(projections_per_image)
+
+average_projections, additional_information = mesh.aggregate_projected_images(
+    cameras=projections_per_image
+)
+
+# The observation counts should reflect how many images saw each face
+assert np.array_equal(
+    additional_information["projection_counts"], [2, 0, 1]
+), "projection counts are wrong"
+# Observed faces should hold the mean across the images that saw them
+assert np.isclose(
+    average_projections[0, 0], 2.0
+), "multi-image face should average to 2"
+assert np.isclose(
+    average_projections[2, 0], 3.0
+), "single-image face should keep its value"
+# The unobserved face should be nan
+assert np.isnan(average_projections[1, 0]), "unobserved face should be nan"